@@ -27,9 +27,11 @@ from src.cache.cache_invalidator import cache_invalidator
 from src.cache.cache_realm import CacheRealm
 from src.core.dca.dca_backtester import DcaBacktester
 from src.core.dca.dca_scheduler import DcaScheduler
-from src.core.structures.structures import DcaStrategyStatus, BlockchainNetwork
+from src.core.structures.structures import DcaStrategyStatus, BlockchainNetwork, EvaluationOutcomeAggregate
 from src.core.trading.analytics.trading_analytics_helpers import map_trading_evaluation
 from src.core.trading.cache.trading_cache import trading_cache
+from src.core.trading.evaluators.trading_cooldown_filter import invalidate_rebuy_cooldown_memo
+from src.core.trading.trading_service import invalidate_committed_cash_flow_totals_memo
 from src.core.utils.date_utils import get_current_local_datetime
 from src.integrations.aave.aave_executor import AaveExecutor
 from src.logging.logger import get_application_logger
@@ -37,6 +39,7 @@ from src.persistence import service
 from src.persistence.dao.dca.dca_order_dao import DcaOrderDao
 from src.persistence.dao.dca.dca_strategy_dao import DcaStrategyDao
 from src.persistence.dao.trading.trading_evaluation_dao import TradingEvaluationDao
+from src.persistence.dao.trading.trading_outcome_dao import TradingOutcomeDao
 from src.persistence.dao.trading.trading_position_dao import TradingPositionDao
 from src.persistence.db import get_fastapi_database_session
 from src.persistence.models import DcaStrategy
@@ -73,6 +76,8 @@ def get_health_status(database_session: Session = Depends(get_fastapi_database_s
 def reset_paper_mode(database_session: Session = Depends(get_fastapi_database_session)) -> TradingPaperResetPayload:
     logger.debug("[HTTP][PAPER][RESET] Initiating paper mode reset process")
     service.reset_paper(database_session)
+    invalidate_committed_cash_flow_totals_memo()
+    invalidate_rebuy_cooldown_memo()
 
     cache_invalidator.mark_dirty(
         CacheRealm.POSITIONS,
@@ -95,13 +100,16 @@ def get_analytics(
     logger.debug("[HTTP][ANALYTICS][FETCH] Retrieving live analytics with limit %s", limit_results)
     evaluation_dao = TradingEvaluationDao(database_session)
     position_dao = TradingPositionDao(database_session)
+    outcome_dao = TradingOutcomeDao(database_session)
 
     evaluation_rows = evaluation_dao.retrieve_recent_evaluations(limit_count=limit_results)
+    outcome_aggregates_by_evaluation_id: dict[int, EvaluationOutcomeAggregate] = {}
+    if evaluation_rows:
+        outcome_aggregates_by_evaluation_id = outcome_dao.retrieve_aggregates_for_evaluations_since(evaluation_rows[-1].evaluated_at)
     total_evaluations = evaluation_dao.count_total_evaluations()
-    staled_positions = position_dao.retrieve_by_phase(PositionPhase.STALED)
-    staled_token_addresses: set[str] = {position.token_address for position in staled_positions}
+    staled_token_addresses = position_dao.retrieve_token_addresses_by_phase(PositionPhase.STALED)
 
-    analytics_records = [map_trading_evaluation(row) for row in evaluation_rows]
+    analytics_records = [map_trading_evaluation(row, outcome_aggregates_by_evaluation_id) for row in evaluation_rows]
     analytics_response = build_analytics_response(analytics_records, total_evaluations, staled_token_addresses)
 
     logger.info("[HTTP][ANALYTICS][FETCH] Successfully processed live analytics")
@@ -203,7 +211,7 @@ def get_shadow_trades_for_pair(
 
 
 @router.get("/api/positions", tags=["positions"])
-async def get_open_positions_list(database_session: Session = Depends(get_fastapi_database_session)) -> TradingPositionsResponse:
+def get_open_positions_list(database_session: Session = Depends(get_fastapi_database_session)) -> TradingPositionsResponse:
     logger.debug("[HTTP][POSITIONS][FETCH] Retrieving currently open positions from cache")
     trading_state = trading_cache.get_trading_state()
     cached_positions = trading_state.positions
@@ -302,7 +310,7 @@ async def get_all_dca_strategies(database_session: Session = Depends(get_fastapi
     dca_strategy_payloads: List[DcaStrategyPayload] = []
     for registered_strategy in all_dca_strategies:
         live_metrics = await aave_executor_client.get_live_metrics(
-            chain=BlockchainNetwork(registered_strategy.blockchain_network.lower()),
+            chain=BlockchainNetwork(registered_strategy.blockchain_network),
             asset_in_address=registered_strategy.source_asset_address,
             asset_out_address=registered_strategy.target_asset_address,
         )
@@ -30,14 +30,14 @@ logger = get_application_logger(__name__)
 
 def serialize_trading_trade(
         trading_trade: TradingTrade,
-        linked_position: TradingPosition,
+        linked_position_payload: TradingPositionPayload,
 ) -> TradingTradePayload:
     return TradingTradePayload(
         id=trading_trade.id,
         evaluation_id=trading_trade.evaluation_id,
         trade_side=trading_trade.trade_side.value,
         token_symbol=trading_trade.token_symbol,
-        blockchain_network=BlockchainNetwork(trading_trade.blockchain_network.lower()),
+        blockchain_network=BlockchainNetwork(trading_trade.blockchain_network),
         execution_price=trading_trade.execution_price,
         execution_quantity=trading_trade.execution_quantity,
         transaction_fee=trading_trade.transaction_fee,
@@ -48,7 +48,7 @@ def serialize_trading_trade(
         transaction_hash=trading_trade.transaction_hash,
         dex_id=trading_trade.dex_id,
         created_at=format_datetime_to_local_iso(trading_trade.created_at),
-        linked_position=serialize_trading_position(linked_position, last_price=None),
+        linked_position=linked_position_payload,
     )
 
 
@@ -66,7 +66,7 @@ def serialize_trading_position(trading_position: TradingPosition, last_price: Op
         take_profit_tier_2_price=trading_position.take_profit_tier_2_price,
         stop_loss_price=trading_position.stop_loss_price,
         position_phase=trading_position.position_phase.value,
-        blockchain_network=BlockchainNetwork(trading_position.blockchain_network.lower()),
+        blockchain_network=BlockchainNetwork(trading_position.blockchain_network),
         dex_id=trading_position.dex_id,
         opened_at=format_datetime_to_local_iso(trading_position.opened_at),
         updated_at=format_datetime_to_local_iso(trading_position.updated_at),
@@ -105,7 +105,7 @@ def serialize_trading_evaluation(row: TradingEvaluation) -> TradingEvaluationPay
     return TradingEvaluationPayload(
         id=row.id,
         token_symbol=row.token_symbol,
-        blockchain_network=BlockchainNetwork(row.blockchain_network.lower()),
+        blockchain_network=BlockchainNetwork(row.blockchain_network),
         token_address=row.token_address,
         pair_address=row.pair_address,
         evaluated_at=format_datetime_to_local_iso(row.evaluated_at),
@@ -171,7 +171,7 @@ def serialize_dca_order(order: DcaOrder) -> DcaOrderPayload:
 def serialize_dca_strategy(strategy: DcaStrategy, live_metrics: AaveLiveMetrics) -> DcaStrategyPayload:
     return DcaStrategyPayload(
         id=strategy.id,
-        blockchain_network=BlockchainNetwork(strategy.blockchain_network.lower()),
+        blockchain_network=BlockchainNetwork(strategy.blockchain_network),
         source_asset_symbol=strategy.source_asset_symbol,
         source_asset_address=strategy.source_asset_address,
         source_asset_decimals=strategy.source_asset_decimals,
@@ -11,7 +11,7 @@ from src.logging.logger import get_application_logger
 from src.persistence.dao.trading.trading_evaluation_dao import TradingEvaluationDao
 from src.persistence.dao.trading.trading_outcome_dao import TradingOutcomeDao
 from src.persistence.db import get_database_session
-from src.persistence.models import TradingEvaluation, TradingOutcome
+from src.persistence.models import TradingEvaluation, TradingOutcome, TradingTrade
 
 logger = get_application_logger(__name__)
 
@@ -32,7 +32,6 @@ class TelemetryService:
         else:
             with get_database_session() as session:
                 serialized_payload = _execute_recording(session)
-                session.commit()
 
         logger.info("[TRADING][TELEMETRY][RECORD] Successfully recorded evaluation event")
         return serialized_payload
@@ -40,7 +39,7 @@ class TelemetryService:
     @staticmethod
     def link_trade_outcome(
             token_address: str,
-            trade_id: int,
+            trading_trade: TradingTrade,
             closed_at: datetime,
             realized_profit_and_loss_percentage: float,
             realized_profit_and_loss_usd: float,
@@ -48,14 +47,20 @@ class TelemetryService:
             was_profitable: bool,
             exit_reason: Optional[str] = None,
             database_session: Optional[Session] = None,
+            buy_decisions_by_token_address: Optional[dict[str, TradingEvaluation]] = None,
     ) -> Optional[TradingEvaluationPayload]:
-        logger.debug("[TRADING][TELEMETRY][OUTCOME] Initiating trade outcome linkage for trade id %s", trade_id)
+        logger.debug("[TRADING][TELEMETRY][OUTCOME] Initiating trade outcome linkage for token %s", token_address)
 
         def _execute_linkage(session_to_use: Session) -> Optional[TradingEvaluationPayload]:
             evaluation_dao = TradingEvaluationDao(session_to_use)
             outcome_dao = TradingOutcomeDao(session_to_use)
 
-            evaluation = evaluation_dao.retrieve_latest_buy_decision(token_address, closed_at.timestamp())
+            if buy_decisions_by_token_address is None:
+                evaluation = evaluation_dao.retrieve_latest_buy_decision(token_address, closed_at.timestamp())
+            elif token_address in buy_decisions_by_token_address:
+                evaluation = buy_decisions_by_token_address[token_address]
+            else:
+                evaluation = None
 
             if not evaluation:
                 logger.warning("[TRADING][TELEMETRY][OUTCOME] Trade outcome linkage failed, no evaluation record found for token %s", token_address)
@@ -63,7 +68,7 @@ class TelemetryService:
 
             outcome_record = TradingOutcome(
                 evaluation_id=evaluation.id,
-                trade_id=trade_id,
+                trade=trading_trade,
                 occurred_at=closed_at,
                 realized_profit_and_loss_percentage=realized_profit_and_loss_percentage,
                 realized_profit_and_loss_usd=realized_profit_and_loss_usd,
@@ -72,19 +77,18 @@ class TelemetryService:
                 exit_reason=exit_reason,
             )
 
-            outcome_dao.save(outcome_record)
-            session_to_use.flush()
+            evaluation_payload = serialize_trading_evaluation(evaluation)
+            outcome_dao.add_pending(outcome_record)
 
-            return serialize_trading_evaluation(evaluation)
+            return evaluation_payload
 
         if database_session is not None:
             serialized_payload = _execute_linkage(database_session)
         else:
             with get_database_session() as session:
                 serialized_payload = _execute_linkage(session)
-                session.commit()
 
         if serialized_payload:
-            logger.info("[TRADING][TELEMETRY][OUTCOME] Successfully linked outcome for trade id %s", trade_id)
+            logger.info("[TRADING][TELEMETRY][OUTCOME] Successfully linked outcome for token %s", token_address)
 
         return serialized_payload
@@ -375,6 +375,7 @@ class AaveSentinelNotificationService:
         )
 
         with get_database_session() as database_session:
+            database_session.expire_on_commit = False
             order_dao = DcaOrderDao(database_session)
             strategy_dao = DcaStrategyDao(database_session)
             target_dca_order = order_dao.retrieve_by_id(target_order_identifier)
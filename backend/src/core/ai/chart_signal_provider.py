@@ -1,6 +1,7 @@
 from __future__ import annotations
 
 import time
+from collections import deque
 from typing import Optional
 
 from src.configuration.config import settings
@@ -22,15 +23,13 @@ class ChartAiSignalProvider:
     def __init__(self) -> None:
         self._capture_service = ChartCaptureService()
         self._openai_client = ChartOpenAiClient()
-        self._request_window_timestamps: list[float] = []
+        self._request_window_timestamps: deque[float] = deque()
         self._signal_cache: dict[str, ChartSignalCacheEntry] = {}
 
     def _is_rate_limit_exceeded(self) -> bool:
         current_time = time.time()
-        self._request_window_timestamps = [
-            request_timestamp for request_timestamp in self._request_window_timestamps
-            if current_time - request_timestamp < 60.0
-        ]
+        while self._request_window_timestamps and current_time - self._request_window_timestamps[0] >= 60.0:
+            self._request_window_timestamps.popleft()
 
         if len(self._request_window_timestamps) >= int(settings.CHART_AI_MAX_REQUESTS_PER_MINUTE):
             return True
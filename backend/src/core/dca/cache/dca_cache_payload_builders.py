@@ -25,7 +25,7 @@ async def _fetch_dca_strategies_with_live_metrics() -> list[DcaStrategyPayload]:
         registered_strategies = strategy_dao.retrieve_all()
         for strategy in registered_strategies:
             live_metrics = await _aave_executor.get_live_metrics(
-                chain=BlockchainNetwork(strategy.blockchain_network.lower()),
+                chain=BlockchainNetwork(strategy.blockchain_network),
                 asset_in_address=strategy.source_asset_address,
                 asset_out_address=strategy.target_asset_address,
             )
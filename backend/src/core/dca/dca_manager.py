@@ -58,7 +58,7 @@ class DcaManager:
 
             if elapsed_seconds > 0:
                 year_fraction = elapsed_seconds / 31536000.0
-                blockchain = BlockchainNetwork(dca_strategy.blockchain_network.lower())
+                blockchain = BlockchainNetwork(dca_strategy.blockchain_network)
                 current_supply_annual_percentage_yield = await self.aave_executor.fetch_supply_apy(blockchain, dca_strategy.source_asset_address)
                 accrued_yield_amount = unspent_investment_budget * current_supply_annual_percentage_yield * year_fraction
                 dca_strategy.realized_aave_yield_amount += accrued_yield_amount
@@ -72,7 +72,7 @@ class DcaManager:
         dca_strategy.last_yield_calculation_timestamp = current_local_time
         self.database_session.commit()
 
-        blockchain = BlockchainNetwork(dca_strategy.blockchain_network.lower())
+        blockchain = BlockchainNetwork(dca_strategy.blockchain_network)
         is_conflicting_debt_detected = await self.aave_executor.verify_active_debt(blockchain, dca_strategy.target_asset_address)
         if is_conflicting_debt_detected:
             logger.error("[DCA][MANAGER][DEBT] Conflicting borrow position detected for target asset. Suspending strategy safety first.")
@@ -256,7 +256,7 @@ class DcaManager:
 
             if dca_order.order_status == DcaOrderStatus.APPROVED:
                 logger.info("[DCA][MANAGER][PIPELINE] Step 1/3: Withdrawing %s liquidity from Aave lending pool", dca_strategy.source_asset_symbol)
-                blockchain = BlockchainNetwork(dca_strategy.blockchain_network.lower())
+                blockchain = BlockchainNetwork(dca_strategy.blockchain_network)
                 withdrawal_transaction_hash = await self.aave_executor.execute_withdrawal(
                     blockchain,
                     dca_strategy.source_asset_address,
@@ -273,7 +273,7 @@ class DcaManager:
 
             if dca_order.order_status == DcaOrderStatus.WITHDRAWN_FROM_AAVE:
                 logger.info("[DCA][MANAGER][PIPELINE] Step 2/3: Fetching LI.FI routing quote for optimal swap path")
-                blockchain = BlockchainNetwork(dca_strategy.blockchain_network.lower())
+                blockchain = BlockchainNetwork(dca_strategy.blockchain_network)
                 await self.aave_executor._initialize_provider(blockchain)
                 current_wallet_address = self.aave_executor.get_wallet_address()
 
@@ -313,7 +313,7 @@ class DcaManager:
 
             if dca_order.order_status == DcaOrderStatus.SWAPPED:
                 logger.info("[DCA][MANAGER][PIPELINE] Step 3/3: Supplying newly acquired asset back to Aave lending pool")
-                blockchain = BlockchainNetwork(dca_strategy.blockchain_network.lower())
+                blockchain = BlockchainNetwork(dca_strategy.blockchain_network)
                 target_asset_balance_wei = await self.aave_executor.fetch_erc20_balance(blockchain, dca_strategy.target_asset_address)
 
                 if target_asset_balance_wei <= 0:
@@ -412,19 +412,17 @@ class DcaManager:
             strategy_dao_instance = DcaStrategyDao(session_instance)
             order_dao_instance = DcaOrderDao(session_instance)
 
+            reopened_order_count = order_dao_instance.reopen_rejected_orders()
+            if reopened_order_count > 0:
+                logger.info("[DCA][MANAGER][RESYNC] Moved %d rejected order(s) back to waiting user approval", reopened_order_count)
+                session_instance.commit()
+
             from sqlalchemy import select
-            waiting_orders_query = select(DcaOrder).where(
-                DcaOrder.order_status.in_([DcaOrderStatus.WAITING_USER_APPROVAL, DcaOrderStatus.REJECTED])
-            )
+            waiting_orders_query = select(DcaOrder).where(DcaOrder.order_status == DcaOrderStatus.WAITING_USER_APPROVAL)
             waiting_orders = session_instance.execute(waiting_orders_query).scalars().all()
 
             for order in waiting_orders:
                 strategy = strategy_dao_instance.retrieve_by_id(order.strategy_id)
                 if strategy:
                     logger.info("[DCA][MANAGER][RESYNC] Re-sending approval request for order identifier %s", order.id)
-                    if order.order_status == DcaOrderStatus.REJECTED:
-                        order.order_status = DcaOrderStatus.WAITING_USER_APPROVAL
-                        order_dao_instance.save(order)
-                        session_instance.commit()
-
                     self._send_approval_request(order, strategy)
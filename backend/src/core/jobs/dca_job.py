@@ -50,6 +50,7 @@ class DcaJob:
 
         for order_id in due_order_ids:
             with get_database_session() as database_session:
+                database_session.expire_on_commit = False
                 order_dao = DcaOrderDao(database_session)
                 strategy_dao = DcaStrategyDao(database_session)
                 manager = DcaManager(database_session)
@@ -2,7 +2,8 @@ from __future__ import annotations
 
 from pydantic import BaseModel
 
-from src.core.structures.structures import Mode
+from src.core.structures.structures import Mode, Token
+from src.core.trading.trading_structures import AutosellPositionThresholds
 
 
 class BackgroundJobsRuntimeStatus(BaseModel):
@@ -17,3 +18,8 @@ class BackgroundJobsRuntimeStatus(BaseModel):
 class ApiStatusResponse(BaseModel):
     ok: bool
     status: BackgroundJobsRuntimeStatus
+
+
+class PositionGuardSnapshot(BaseModel):
+    position_tokens: list[Token]
+    active_position_thresholds: list[AutosellPositionThresholds]
@@ -5,9 +5,15 @@ import asyncio
 from src.cache.cache_invalidator import cache_invalidator
 from src.cache.cache_realm import CacheRealm
 from src.configuration.config import settings
+from src.core.jobs.job_structures import PositionGuardSnapshot
 from src.core.structures.structures import Token, BlockchainNetwork
 from src.core.trading.cache.trading_cache import trading_cache
-from src.core.trading.execution.trading_autosell import check_thresholds_and_autosell_for_token_address
+from src.core.trading.execution.trading_autosell import (
+    build_active_position_thresholds,
+    check_thresholds_and_autosell_for_triggered_positions,
+    resolve_triggered_position_prices,
+)
+from src.core.trading.trading_service import invalidate_trading_positions_and_trades_cache
 from src.integrations.blockchain.blockchain_price_service import fetch_onchain_prices_for_tokens
 from src.logging.logger import get_application_logger
 from src.persistence.dao.trading.trading_position_dao import TradingPositionDao
@@ -28,66 +34,50 @@ class TradingPositionGuardJob:
             await asyncio.sleep(interval)
 
     async def _execute_guard_cycle(self) -> None:
-        position_tokens = await asyncio.to_thread(self._read_position_tokens)
+        guard_snapshot = await asyncio.to_thread(self._read_position_guard_snapshot)
 
         try:
-            prices_by_pair_address = await asyncio.to_thread(fetch_onchain_prices_for_tokens, position_tokens)
+            prices_by_pair_address = await asyncio.to_thread(fetch_onchain_prices_for_tokens, guard_snapshot.position_tokens)
         except Exception:
             logger.exception("[TRADING][POSITION_GUARD][CYCLE] On-chain price fetch failed")
             return
 
         trading_cache.update_prices_by_pair_address(prices_by_pair_address)
 
-        await asyncio.to_thread(self._run_autosell_evaluations_for_tokens, position_tokens, prices_by_pair_address)
+        last_price_by_triggered_position_id = resolve_triggered_position_prices(guard_snapshot.active_position_thresholds, prices_by_pair_address)
+        if last_price_by_triggered_position_id:
+            await asyncio.to_thread(self._run_autosell_for_triggered_positions, last_price_by_triggered_position_id)
+        else:
+            logger.debug("[TRADING][POSITION_GUARD][CYCLE] No threshold crossed by %d active positions", len(guard_snapshot.active_position_thresholds))
 
         cache_invalidator.mark_dirty(CacheRealm.AVAILABLE_CASH, CacheRealm.POSITION_PRICES, CacheRealm.PORTFOLIO)
 
     @staticmethod
-    def _read_position_tokens() -> list[Token]:
+    def _read_position_guard_snapshot() -> PositionGuardSnapshot:
         with get_database_session() as database_session:
             position_dao = TradingPositionDao(database_session)
             open_position_records = position_dao.retrieve_open_positions()
-            return [
+            position_tokens = [
                 Token(
                     symbol=position.token_symbol,
-                    chain=BlockchainNetwork(position.blockchain_network.lower()),
+                    chain=BlockchainNetwork(position.blockchain_network),
                     token_address=position.token_address,
                     pair_address=position.pair_address,
                     dex_id=position.dex_id,
                 )
                 for position in open_position_records
             ]
+            return PositionGuardSnapshot(
+                position_tokens=position_tokens,
+                active_position_thresholds=build_active_position_thresholds(open_position_records),
+            )
 
     @staticmethod
-    def _run_autosell_evaluations_for_tokens(
-            position_tokens: list[Token],
-            prices_by_pair_address: dict[str, float],
-    ) -> None:
+    def _run_autosell_for_triggered_positions(last_price_by_triggered_position_id: dict[int, float]) -> None:
         with get_database_session() as database_session:
             database_session.expire_on_commit = False
+            autosell_trade_records = check_thresholds_and_autosell_for_triggered_positions(database_session, last_price_by_triggered_position_id)
 
-            autosell_trade_records = []
-
-            for token in position_tokens:
-                pair_address_label = token.pair_address
-                if pair_address_label is None or pair_address_label == "":
-                    continue
-                if pair_address_label not in prices_by_pair_address:
-                    continue
-                price_usd = prices_by_pair_address[pair_address_label]
-                if price_usd <= 0.0:
-                    continue
-                try:
-                    newly_created_trades = check_thresholds_and_autosell_for_token_address(
-                        database_session, token, price_usd,
-                    )
-                    if newly_created_trades:
-                        autosell_trade_records.extend(newly_created_trades)
-                except Exception:
-                    logger.exception(
-                        "[TRADING][POSITION_GUARD][CYCLE] Autosell evaluation failed for %s",
-                        token.symbol,
-                    )
-
-            if autosell_trade_records:
-                logger.info("[TRADING][POSITION_GUARD][CYCLE] Executed %s automated sell trades", len(autosell_trade_records))
+        if autosell_trade_records:
+            invalidate_trading_positions_and_trades_cache()
+            logger.info("[TRADING][POSITION_GUARD][CYCLE] Executed %s automated sell trades", len(autosell_trade_records))
@@ -1,3 +1,4 @@
+from datetime import datetime
 from enum import Enum
 from typing import List, Optional
 
@@ -48,6 +49,28 @@ class CashFromTrades(BaseModel):
     total_fees_paid: float
 
 
+class TradeCashFlowTotals(BaseModel):
+    total_buy_volume: float
+    total_sell_volume: float
+    total_fees_paid: float
+
+
+class OpenPositionIdentifiers(BaseModel):
+    token_symbols: frozenset[str]
+    token_addresses: frozenset[str]
+
+
+class EvaluationOutcomeAggregate(BaseModel):
+    evaluation_id: int
+    outcome_count: int
+    total_realized_profit_and_loss_usd: float
+    average_realized_profit_and_loss_percentage: float
+    average_holding_duration_minutes: float
+    has_profitable_outcome: bool
+    last_exit_reason: str
+    last_occurred_at: datetime
+
+
 class HoldingsAndUnrealizedProfitAndLoss(BaseModel):
     total_holdings_value: float
     total_unrealized_profit_and_loss: float
@@ -84,6 +107,13 @@ class WebsocketMessageType(str, Enum):
     PING = "ping"
 
 
+class PositionPhase(Enum):
+    OPEN = "OPEN"
+    PARTIAL = "PARTIAL"
+    CLOSED = "CLOSED"
+    STALED = "STALED"
+
+
 class DcaStrategyStatus(Enum):
     ACTIVE = "ACTIVE"
     PAUSED = "PAUSED"
@@ -1,5 +1,6 @@
 from __future__ import annotations
 
+from src.core.structures.structures import EvaluationOutcomeAggregate
 from src.core.trading.analytics.trading_analytics_structures import AnalyticsOutcomeRecord
 from src.persistence.models import TradingShadowingVerdict, TradingEvaluation, TradingOutcome
 
@@ -62,37 +63,39 @@ def format_metric_value(value: float, unit: str) -> str:
     return f"{value:,.1f}"
 
 
-def aggregate_evaluation_outcomes(evaluation: TradingEvaluation) -> TradingOutcome | None:
-    if not evaluation.outcomes:
+def aggregate_evaluation_outcomes(
+        evaluation: TradingEvaluation,
+        outcome_aggregates_by_evaluation_id: dict[int, EvaluationOutcomeAggregate],
+) -> TradingOutcome | None:
+    if evaluation.id not in outcome_aggregates_by_evaluation_id:
         return None
 
-    if len(evaluation.outcomes) == 1:
-        return evaluation.outcomes[0]
+    outcome_aggregate = outcome_aggregates_by_evaluation_id[evaluation.id]
+    total_profit_and_loss_usd = outcome_aggregate.total_realized_profit_and_loss_usd
+    total_profit_and_loss_percentage = outcome_aggregate.average_realized_profit_and_loss_percentage
+    is_profitable = outcome_aggregate.has_profitable_outcome
 
-    total_profit_and_loss_usd = sum(outcome.realized_profit_and_loss_usd for outcome in evaluation.outcomes)
-    average_holding_duration_minutes = sum(outcome.holding_duration_minutes for outcome in evaluation.outcomes) / len(evaluation.outcomes)
-    is_profitable = total_profit_and_loss_usd > 0
-
-    cost_basis = evaluation.order_notional_value_usd
-    if cost_basis and cost_basis > 0:
-        total_profit_and_loss_percentage = (total_profit_and_loss_usd / cost_basis) * 100.0
-    else:
-        total_profit_and_loss_percentage = sum(outcome.realized_profit_and_loss_percentage for outcome in evaluation.outcomes) / len(evaluation.outcomes)
-
-    last_outcome = evaluation.outcomes[-1]
+    if outcome_aggregate.outcome_count > 1:
+        is_profitable = total_profit_and_loss_usd > 0
+        cost_basis = evaluation.order_notional_value_usd
+        if cost_basis and cost_basis > 0:
+            total_profit_and_loss_percentage = (total_profit_and_loss_usd / cost_basis) * 100.0
 
     return TradingOutcome(
         realized_profit_and_loss_usd=total_profit_and_loss_usd,
         realized_profit_and_loss_percentage=total_profit_and_loss_percentage,
-        holding_duration_minutes=average_holding_duration_minutes,
+        holding_duration_minutes=outcome_aggregate.average_holding_duration_minutes,
         is_profitable=is_profitable,
-        exit_reason=last_outcome.exit_reason,
-        occurred_at=last_outcome.occurred_at
+        exit_reason=outcome_aggregate.last_exit_reason,
+        occurred_at=outcome_aggregate.last_occurred_at
     )
 
 
-def map_trading_evaluation(evaluation: TradingEvaluation) -> AnalyticsOutcomeRecord:
-    outcome = aggregate_evaluation_outcomes(evaluation)
+def map_trading_evaluation(
+        evaluation: TradingEvaluation,
+        outcome_aggregates_by_evaluation_id: dict[int, EvaluationOutcomeAggregate],
+) -> AnalyticsOutcomeRecord:
+    outcome = aggregate_evaluation_outcomes(evaluation, outcome_aggregates_by_evaluation_id)
     has_outcome = outcome is not None
     return AnalyticsOutcomeRecord(
         token_symbol=evaluation.token_symbol,
@@ -1,6 +1,6 @@
 from __future__ import annotations
 
-from decimal import Decimal
+import math
 from typing import Iterable, Optional
 
 from src.api.http.api_schemas import (
@@ -45,7 +45,7 @@ def build_trading_prices_payload() -> dict[str, float]:
         tokens = [
             Token(
                 symbol=position.token_symbol,
-                chain=BlockchainNetwork(position.blockchain_network.lower()),
+                chain=BlockchainNetwork(position.blockchain_network),
                 token_address=position.token_address,
                 pair_address=position.pair_address,
                 dex_id=position.dex_id,
@@ -82,7 +82,7 @@ def build_trading_portfolio_payload_with_snapshot_creation() -> Optional[Trading
         position_tokens_seed = [
             Token(
                 symbol=position.token_symbol,
-                chain=BlockchainNetwork(position.blockchain_network.lower()),
+                chain=BlockchainNetwork(position.blockchain_network),
                 token_address=position.token_address,
                 pair_address=position.pair_address,
                 dex_id=position.dex_id,
@@ -119,8 +119,7 @@ def build_trading_portfolio_payload_with_snapshot_creation() -> Optional[Trading
         holdings_data = holdings_and_unrealized_from_positions(open_positions, prices_lookup)
         total_equity_usd = round(available_cash_usd + holdings_data.total_holdings_value, 2)
 
-        trading_portfolio_snapshot = portfolio_dao.retrieve_initial_snapshot()
-        if not trading_portfolio_snapshot:
+        if not portfolio_dao.has_any_snapshot():
             portfolio_dao.create_snapshot(
                 equity=available_cash_usd,
                 cash=available_cash_usd,
@@ -146,35 +145,28 @@ def holdings_and_unrealized_from_positions(
         positions: Iterable[TradingPosition],
         prices_by_pair_address: dict[str, float],
 ) -> HoldingsAndUnrealizedProfitAndLoss:
-    from src.core.trading.trading_utils import convert_trading_position_to_token
-    position_list = list(positions)
-    holdings_value_dec = Decimal("0")
-    unrealized_dec = Decimal("0")
-
-    for position in position_list:
-        token = convert_trading_position_to_token(position)
-        pair_address_value = position.pair_address
-        price_usd: Optional[float] = None
-        if pair_address_value is not None and pair_address_value != "":
-            if pair_address_value in prices_by_pair_address:
-                price_usd = prices_by_pair_address[pair_address_value]
-        entry_price = position.entry_price or 0.0
+    holdings_values_usd: list[float] = []
+    unrealized_values_usd: list[float] = []
+
+    for position in positions:
+        price_usd = _resolve_last_price_for_pair_address(position.pair_address, prices_by_pair_address)
+        entry_price = position.entry_price
 
         if price_usd is None or price_usd <= 0.0:
-            logger.debug("[PNL][UNREAL][SKIP] token=%s reason=missing_onchain_price", token)
+            logger.debug("[PNL][UNREAL][SKIP] symbol=%s pair_address=%s reason=missing_onchain_price", position.token_symbol, position.pair_address)
             continue
 
-        quantity = position.current_quantity or 0.0
+        quantity = position.current_quantity
         if quantity <= 0.0:
-            logger.debug("[PNL][UNREAL][SKIP] token=%s reason=non_positive_qty", token)
+            logger.debug("[PNL][UNREAL][SKIP] symbol=%s pair_address=%s reason=non_positive_qty", position.token_symbol, position.pair_address)
             continue
 
-        holdings_value_dec += decimal_from_primitive(quantity * price_usd)
-        unrealized_dec += decimal_from_primitive((price_usd - entry_price) * quantity)
+        holdings_values_usd.append(quantity * price_usd)
+        unrealized_values_usd.append((price_usd - entry_price) * quantity)
 
     return HoldingsAndUnrealizedProfitAndLoss(
-        total_holdings_value=float(quantize_2dp(holdings_value_dec)),
-        total_unrealized_profit_and_loss=float(quantize_2dp(unrealized_dec)),
+        total_holdings_value=float(quantize_2dp(decimal_from_primitive(math.fsum(holdings_values_usd)))),
+        total_unrealized_profit_and_loss=float(quantize_2dp(decimal_from_primitive(math.fsum(unrealized_values_usd)))),
     )
 
 
@@ -183,22 +175,20 @@ def build_trading_trades_payloads() -> list[TradingTradePayload]:
         trade_dao = TradingTradeDao(database_session)
         position_dao = TradingPositionDao(database_session)
         recent_trade_records = trade_dao.retrieve_recent_trades(limit_count=10000)
-        evaluation_ids = [trade_record.evaluation_id for trade_record in recent_trade_records]
-        linked_positions = position_dao.retrieve_by_evaluation_ids(evaluation_ids)
-        positions_by_evaluation_id: dict[int, TradingPosition] = {}
-        for linked_position in linked_positions:
-            existing = positions_by_evaluation_id.get(linked_position.evaluation_id)
-            if existing is None or linked_position.id > existing.id:
-                positions_by_evaluation_id[linked_position.evaluation_id] = linked_position
+        evaluation_ids = list({trade_record.evaluation_id for trade_record in recent_trade_records})
+        linked_positions = position_dao.retrieve_latest_by_evaluation_ids(evaluation_ids)
+        position_payloads_by_evaluation_id: dict[int, TradingPositionPayload] = {
+            linked_position.evaluation_id: serialize_trading_position(linked_position, last_price=None)
+            for linked_position in linked_positions
+        }
 
         payloads: list[TradingTradePayload] = []
         for trade_record in recent_trade_records:
-            linked_position = positions_by_evaluation_id.get(trade_record.evaluation_id)
-            if linked_position is None:
+            if trade_record.evaluation_id not in position_payloads_by_evaluation_id:
                 raise ValueError(
                     f"Missing linked trading position for trade_id={trade_record.id} evaluation_id={trade_record.evaluation_id}"
                 )
-            payloads.append(serialize_trading_trade(trade_record, linked_position))
+            payloads.append(serialize_trading_trade(trade_record, position_payloads_by_evaluation_id[trade_record.evaluation_id]))
         return payloads
 
 
@@ -238,16 +228,13 @@ def build_trading_liquidity_payload() -> TradingLiquidityPayload:
 def build_trading_positions_payloads(prices_by_pair_address: dict[str, float]) -> list[TradingPositionPayload]:
     with get_database_session() as database_session:
         position_dao = TradingPositionDao(database_session)
-        open_position_records = position_dao.retrieve_open_positions()
-        payloads: list[TradingPositionPayload] = []
-        for position_record in open_position_records:
-            pair_address_value = position_record.pair_address
-            last_price_candidate: Optional[float] = None
-            if pair_address_value is not None and pair_address_value != "":
-                if pair_address_value in prices_by_pair_address:
-                    last_price_candidate = prices_by_pair_address[pair_address_value]
-            payloads.append(serialize_trading_position(position_record, last_price=last_price_candidate))
-        return payloads
+        return [
+            serialize_trading_position(
+                position_record,
+                last_price=_resolve_last_price_for_pair_address(position_record.pair_address, prices_by_pair_address),
+            )
+            for position_record in position_dao.retrieve_open_positions()
+        ]
 
 
 def build_trading_position_prices_payloads(
@@ -259,18 +246,11 @@ def build_trading_position_prices_payloads(
         payloads: list[TradingPositionPricePayload] = []
         for position_record in open_position_records:
             pair_address_value = position_record.pair_address
-            last_price_candidate: Optional[float] = None
-            if pair_address_value is not None and pair_address_value != "":
-                if pair_address_value in prices_by_pair_address:
-                    last_price_candidate = prices_by_pair_address[pair_address_value]
+            last_price_candidate = _resolve_last_price_for_pair_address(pair_address_value, prices_by_pair_address)
 
             delta_percent_candidate: Optional[float] = None
-            entry_price_value = position_record.entry_price if position_record.entry_price is not None else 0.0
-            if (
-                    last_price_candidate is not None
-                    and entry_price_value is not None
-                    and entry_price_value != 0.0
-            ):
+            entry_price_value = position_record.entry_price
+            if last_price_candidate is not None and entry_price_value != 0.0:
                 delta_percent_candidate = ((last_price_candidate - entry_price_value) / abs(entry_price_value)) * 100.0
 
             payloads.append(TradingPositionPricePayload(
@@ -346,23 +326,15 @@ def build_trading_portfolio_payload_reusing_cached_chain_balances(
         snapshot_candidate = portfolio_dao.retrieve_latest_snapshot()
         if snapshot_candidate is None:
             return None
+        if not _paired_open_positions_have_full_usable_prices(open_positions_list, prices_lookup):
+            if previous_portfolio_candidate is not None:
+                logger.warning(
+                    "[TRADING][CACHE][PORTFOLIO][LIVE_GUARD] "
+                    "Incomplete on-chain prices for paired open positions; retaining cached portfolio"
+                )
+                return previous_portfolio_candidate
+            return None
         holdings_result = holdings_and_unrealized_from_positions(open_positions_list, prices_lookup)
-        paired_open_positions_list = [
-            position_row for position_row in open_positions_list
-            if position_row.pair_address not in (None, "")
-        ]
-        for position_row in paired_open_positions_list:
-            pair_key = position_row.pair_address
-            if pair_key is None or pair_key == "":
-                continue
-            if pair_key not in prices_lookup or prices_lookup[pair_key] <= 0.0:
-                if previous_portfolio_candidate is not None:
-                    logger.warning(
-                        "[TRADING][CACHE][PORTFOLIO][LIVE_GUARD] "
-                        "Incomplete on-chain prices for paired open positions; retaining cached portfolio"
-                    )
-                    return previous_portfolio_candidate
-                return None
     try:
         return build_trading_portfolio_payload(
             trades_payload_list,
@@ -442,3 +414,12 @@ def _merge_incremental_onchain_prices_for_open_positions(
     merged_lookup.update(fetched_incremental_partial)
     trading_cache.update_prices_by_pair_address(merged_lookup)
     return merged_lookup
+
+
+def _resolve_last_price_for_pair_address(
+        pair_address: Optional[str],
+        prices_by_pair_address: dict[str, float],
+) -> Optional[float]:
+    if not pair_address or pair_address not in prices_by_pair_address:
+        return None
+    return prices_by_pair_address[pair_address]
@@ -2,47 +2,71 @@ from __future__ import annotations
 
 from datetime import timedelta
 
-from sqlalchemy import select
-
 from src.configuration.config import settings
 from src.core.trading.trading_structures import TradingCandidate
-from src.core.utils.date_utils import get_current_local_datetime
+from src.core.utils.date_utils import ensure_timezone_aware, get_current_local_datetime
 from src.logging.logger import get_application_logger
+from src.persistence.dao.trading.trading_trade_dao import TradingTradeDao
 from src.persistence.db import get_database_session
-from src.persistence.models import TradingTrade
 
 logger = get_application_logger(__name__)
 
+REBUY_COOLDOWN_MINUTES = settings.TRADING_REBUY_COOLDOWN_MINUTES
+REBUY_COOLDOWN_WINDOW = timedelta(minutes=REBUY_COOLDOWN_MINUTES)
+REBUY_COOLDOWN_WINDOW_SECONDS = REBUY_COOLDOWN_WINDOW.total_seconds()
+
+_cooldown_expiration_timestamps_by_token_address: dict[str, float] = {}
+
+
+def invalidate_rebuy_cooldown_memo() -> None:
+    _cooldown_expiration_timestamps_by_token_address.clear()
+    logger.debug("[TRADING][FILTER][COOLDOWN] Rebuy cooldown memo cleared after trade history reset")
+
+
+def _load_recently_traded_token_addresses(token_addresses: list[str]) -> set[str]:
+    if not token_addresses:
+        return set()
+
+    current_time = get_current_local_datetime()
+    current_timestamp = current_time.timestamp()
+    expired_token_addresses = [
+        token_address
+        for token_address, cooldown_expiration_timestamp in _cooldown_expiration_timestamps_by_token_address.items()
+        if cooldown_expiration_timestamp <= current_timestamp
+    ]
+    for token_address in expired_token_addresses:
+        del _cooldown_expiration_timestamps_by_token_address[token_address]
 
-def _recently_traded(address: str, time_window_minutes: int) -> bool:
-    if not address:
-        return False
+    cooling_down_token_addresses = {token_address for token_address in token_addresses if token_address in _cooldown_expiration_timestamps_by_token_address}
+    unresolved_token_addresses = [token_address for token_address in token_addresses if token_address not in cooling_down_token_addresses]
+    if not unresolved_token_addresses:
+        return cooling_down_token_addresses
 
     with get_database_session() as database_session:
-        database_query = (
-            select(TradingTrade)
-            .where(TradingTrade.token_address == address)
-            .order_by(TradingTrade.created_at.desc())
-        )
-        trade_record = database_session.execute(database_query).scalars().first()
-        if not trade_record:
-            return False
+        trade_dao = TradingTradeDao(database_session)
+        latest_trade_datetimes = trade_dao.retrieve_latest_trade_datetimes_after(unresolved_token_addresses, current_time - REBUY_COOLDOWN_WINDOW)
 
-        current_time = get_current_local_datetime()
-        trade_creation_time = trade_record.created_at.astimezone()
-        return (current_time - trade_creation_time) < timedelta(minutes=time_window_minutes)
+    for token_address, latest_traded_at in latest_trade_datetimes.items():
+        _cooldown_expiration_timestamps_by_token_address[token_address] = ensure_timezone_aware(latest_traded_at).timestamp() + REBUY_COOLDOWN_WINDOW_SECONDS
+        cooling_down_token_addresses.add(token_address)
+    return cooling_down_token_addresses
 
 
 def apply_cooldown_filter(candidates: list[TradingCandidate]) -> list[TradingCandidate]:
     from src.core.trading.analytics.trading_evaluation_recorder import TradingEvaluationRecorder
 
-    cooldown_minutes = settings.TRADING_REBUY_COOLDOWN_MINUTES
+    candidate_token_addresses = [
+        candidate.dexscreener_token_information.base_token.address
+        for candidate in candidates
+        if candidate.dexscreener_token_information.base_token.address
+    ]
+    recently_traded_token_addresses = _load_recently_traded_token_addresses(candidate_token_addresses)
     retained: list[TradingCandidate] = []
 
     for candidate in candidates:
         token_address = candidate.dexscreener_token_information.base_token.address
-        if token_address and _recently_traded(token_address, time_window_minutes=cooldown_minutes):
-            logger.debug("[TRADING][FILTER][COOLDOWN] %s — recently traded within %d minutes", candidate.dexscreener_token_information.base_token.symbol, cooldown_minutes)
+        if token_address and token_address in recently_traded_token_addresses:
+            logger.debug("[TRADING][FILTER][COOLDOWN] %s — recently traded within %d minutes", candidate.dexscreener_token_information.base_token.symbol, REBUY_COOLDOWN_MINUTES)
             TradingEvaluationRecorder.persist_and_broadcast_skip(candidate, len(retained) + 1, "COOLDOWN")
             continue
 
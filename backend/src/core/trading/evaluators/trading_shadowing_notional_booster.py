@@ -29,6 +29,10 @@ def apply_shadowing_notional_boost(
     for candidate in candidates:
         golden_notional_accumulator = 0.0
         evaluated_influence_weight = 0.0
+        evaluated_metrics_by_key = {
+            evaluated_metric.metric_key: evaluated_metric
+            for evaluated_metric in candidate.shadow_diagnostics.intelligence_snapshot.evaluated_metrics
+        }
 
         for metric_snapshot in snapshot.metric_snapshots:
             try:
@@ -59,11 +63,10 @@ def apply_shadowing_notional_boost(
                     golden_notional_accumulator += normalized_influence * golden_strength
                     candidate.shadow_diagnostics.golden_metric_keys.append(metric_snapshot.metric_key)
 
-            for evaluated_metric in candidate.shadow_diagnostics.intelligence_snapshot.evaluated_metrics:
-                if evaluated_metric.metric_key == metric_snapshot.metric_key:
-                    evaluated_metric.is_golden = is_golden
-                    evaluated_metric.normalized_influence = normalized_influence
-                    break
+            if metric_snapshot.metric_key in evaluated_metrics_by_key:
+                evaluated_metric = evaluated_metrics_by_key[metric_snapshot.metric_key]
+                evaluated_metric.is_golden = is_golden
+                evaluated_metric.normalized_influence = normalized_influence
 
         notional_multiplier = 1.0 + golden_notional_accumulator * (maximum_notional_multiplier - 1.0)
         notional_multiplier = max(1.0, min(maximum_notional_multiplier, notional_multiplier))
@@ -1,52 +1,111 @@
 from __future__ import annotations
 
+from datetime import datetime
 from typing import List, Optional
 
-from sqlalchemy import select
+from sqlalchemy import bindparam, select
 from sqlalchemy.orm import Session
 
 from src.api.websocket.telemetry import TelemetryService
 from src.configuration.config import settings
-from src.core.structures.structures import Token, BlockchainNetwork
+from src.core.structures.structures import BlockchainNetwork
 from src.core.trading.execution.trading_executor import TradingExecutor
 from src.core.trading.execution.trading_order_builder import build_route_for_live_sell
-from src.core.trading.trading_service import invalidate_trading_positions_and_trades_cache
-from src.core.trading.trading_structures import AutosellTriggerReason
+from src.core.trading.trading_structures import AutosellTriggerReason, AutosellPositionThresholds
 from src.core.utils.date_utils import get_current_local_datetime
+from src.core.utils.math_utils import clamp
 from src.logging.logger import get_application_logger
+from src.persistence.dao.trading.trading_evaluation_dao import TradingEvaluationDao
 from src.persistence.dao.trading.trading_trade_dao import TradingTradeDao
-from src.persistence.models import TradingPosition, TradingTrade, ExecutionStatus, PositionPhase, TradeSide
+from src.persistence.models import TradingPosition, TradingTrade, TradingEvaluation, ExecutionStatus, PositionPhase, TradeSide
 
 logger = get_application_logger(__name__)
 
-
-def check_thresholds_and_autosell_for_token_address(
+TAKE_PROFIT_TIER_1_SELL_FRACTION = clamp(settings.TRADING_TP1_TAKE_PROFIT_FRACTION, 0.0, 1.0)
+TRIGGERED_POSITIONS_DATABASE_QUERY = select(TradingPosition).where(
+    TradingPosition.id.in_(bindparam("triggered_position_ids", expanding=True)),
+    TradingPosition.position_phase.in_([PositionPhase.OPEN, PositionPhase.PARTIAL]),
+)
+
+
+def build_active_position_thresholds(open_positions: List[TradingPosition]) -> List[AutosellPositionThresholds]:
+    return [
+        _build_position_thresholds(open_position)
+        for open_position in open_positions
+        if open_position.position_phase in (PositionPhase.OPEN, PositionPhase.PARTIAL)
+    ]
+
+
+def resolve_triggered_position_prices(
+        active_position_thresholds: List[AutosellPositionThresholds],
+        prices_by_pair_address: dict[str, float],
+) -> dict[int, float]:
+    last_price_by_triggered_position_id: dict[int, float] = {}
+    for position_thresholds in active_position_thresholds:
+        pair_address_label = position_thresholds.pair_address
+        if pair_address_label is None or pair_address_label == "":
+            continue
+        if pair_address_label not in prices_by_pair_address:
+            continue
+        last_price = prices_by_pair_address[pair_address_label]
+        if last_price <= 0.0:
+            continue
+        if _determine_autosell_trigger_reason(position_thresholds, last_price) is None:
+            continue
+        last_price_by_triggered_position_id[position_thresholds.position_id] = last_price
+    return last_price_by_triggered_position_id
+
+
+def check_thresholds_and_autosell_for_triggered_positions(
         database_session: Session,
-        token: Token,
-        last_price: float,
+        last_price_by_triggered_position_id: dict[int, float],
 ) -> List[TradingTrade]:
     created_trades: List[TradingTrade] = []
-    if not token or last_price <= 0.0:
+    if not last_price_by_triggered_position_id:
         return created_trades
 
-    database_query = select(TradingPosition).where(
-        TradingPosition.blockchain_network == token.chain.value,
-        TradingPosition.token_address == token.token_address,
-        TradingPosition.pair_address == token.pair_address,
-        TradingPosition.position_phase.in_([PositionPhase.OPEN, PositionPhase.PARTIAL]),
+    triggered_positions = database_session.execute(
+        TRIGGERED_POSITIONS_DATABASE_QUERY,
+        {"triggered_position_ids": list(last_price_by_triggered_position_id)},
+    ).scalars().all()
+    logger.debug("[TRADING][AUTOSELL][BATCH] %d positions hit a threshold", len(triggered_positions))
+
+    execution_time = get_current_local_datetime()
+    evaluation_dao = TradingEvaluationDao(database_session)
+    buy_decisions_by_token_address = evaluation_dao.retrieve_latest_buy_decisions_by_token_addresses(
+        [position.token_address for position in triggered_positions],
+        execution_time.timestamp(),
     )
-    position = database_session.execute(database_query).scalars().first()
-
-    if not position:
-        return created_trades
+    for position in triggered_positions:
+        position_token_symbol = position.token_symbol
+        try:
+            position_trades = _evaluate_position_thresholds(
+                database_session,
+                position,
+                last_price_by_triggered_position_id[position.id],
+                execution_time,
+                buy_decisions_by_token_address,
+            )
+            database_session.commit()
+            created_trades.extend(position_trades)
+        except Exception:
+            database_session.rollback()
+            logger.exception("[TRADING][AUTOSELL][BATCH] Autosell evaluation failed for %s, its changes were rolled back", position_token_symbol)
 
-    created_trades = _evaluate_position_thresholds(database_session, position, last_price)
+    return created_trades
 
-    if created_trades:
-        database_session.commit()
-        invalidate_trading_positions_and_trades_cache()
 
-    return created_trades
+def _build_position_thresholds(position: TradingPosition) -> AutosellPositionThresholds:
+    return AutosellPositionThresholds(
+        position_id=position.id,
+        token_symbol=position.token_symbol,
+        pair_address=position.pair_address,
+        position_phase=position.position_phase,
+        current_quantity=position.current_quantity,
+        take_profit_tier_1_price=position.take_profit_tier_1_price,
+        take_profit_tier_2_price=position.take_profit_tier_2_price,
+        stop_loss_price=position.stop_loss_price,
+    )
 
 
 def _execute_sell_operation(
@@ -55,13 +114,14 @@ def _execute_sell_operation(
         execution_price: float,
         sell_quantity: float,
         reason: AutosellTriggerReason,
+        execution_time: datetime,
+        buy_decisions_by_token_address: Optional[dict[str, TradingEvaluation]] = None,
 ) -> Optional[TradingTrade]:
     if not settings.PAPER_MODE:
-        chain_lower = position.blockchain_network.strip().lower()
         try:
-            chain_enum = BlockchainNetwork(chain_lower)
+            chain_enum = BlockchainNetwork(position.blockchain_network)
         except ValueError:
-            logger.error("[TRADING][AUTOSELL] Unknown chain in DB: %s", chain_lower)
+            logger.error("[TRADING][AUTOSELL] Unknown chain in DB: %s", position.blockchain_network)
             return None
 
         if chain_enum == BlockchainNetwork.SOLANA:
@@ -154,83 +214,108 @@ def _execute_sell_operation(
         pair_address=position.pair_address,
         dex_id=position.dex_id,
         transaction_hash=live_transaction_hash,
+        created_at=execution_time,
     )
-    trade_dao.save(sell_trade)
+    trade_dao.add_pending(sell_trade)
 
     if reason in (AutosellTriggerReason.STOP_LOSS, AutosellTriggerReason.TAKE_PROFIT_2):
-        position.current_quantity = 0.0
+        remaining_quantity_after_sell = 0.0
+    else:
+        remaining_quantity_after_sell = position.current_quantity - sell_quantity
+
+    position.current_quantity = remaining_quantity_after_sell
+    if remaining_quantity_after_sell <= 0.0:
         position.position_phase = PositionPhase.CLOSED
     else:
-        position.current_quantity -= sell_quantity
-        if position.current_quantity <= 0.0:
-            position.position_phase = PositionPhase.CLOSED
-        else:
-            position.position_phase = PositionPhase.PARTIAL
+        position.position_phase = PositionPhase.PARTIAL
 
+    entry_price = position.entry_price
     exit_notional = sell_quantity * execution_price
-    entry_notional = sell_quantity * position.entry_price
+    entry_notional = sell_quantity * entry_price
     trade_pnl_usd = exit_notional - entry_notional
     sell_trade.realized_profit_and_loss = trade_pnl_usd
 
-    database_session.flush()
+    try:
+        pnl_percentage = ((execution_price / entry_price) - 1) * 100
 
-    pnl_percentage = ((execution_price / position.entry_price) - 1) * 100
+        current_time = execution_time.replace(tzinfo=None)
+        opened_at = position.opened_at
+        opened_time = opened_at.replace(tzinfo=None) if opened_at else current_time
+        holding_duration = (current_time - opened_time).total_seconds() / 60.0
 
-    current_time = get_current_local_datetime().replace(tzinfo=None)
-    opened_time = position.opened_at.replace(tzinfo=None) if position.opened_at else current_time
-    holding_duration = (current_time - opened_time).total_seconds() / 60.0
-
-    TelemetryService.link_trade_outcome(
-        token_address=position.token_address,
-        trade_id=sell_trade.id,
-        closed_at=get_current_local_datetime(),
-        realized_profit_and_loss_percentage=pnl_percentage,
-        realized_profit_and_loss_usd=trade_pnl_usd,
-        holding_duration_minutes=holding_duration,
-        was_profitable=(trade_pnl_usd > 0),
-        exit_reason=reason.value,
-        database_session=database_session,
-    )
+        TelemetryService.link_trade_outcome(
+            token_address=position.token_address,
+            trading_trade=sell_trade,
+            closed_at=execution_time,
+            realized_profit_and_loss_percentage=pnl_percentage,
+            realized_profit_and_loss_usd=trade_pnl_usd,
+            holding_duration_minutes=holding_duration,
+            was_profitable=(trade_pnl_usd > 0),
+            exit_reason=reason.value,
+            database_session=database_session,
+            buy_decisions_by_token_address=buy_decisions_by_token_address,
+        )
+    except Exception:
+        logger.exception("[TRADING][AUTOSELL] Outcome linkage failed for %s, the executed sell trade is kept", position.token_symbol)
 
     return sell_trade
 
 
+def _determine_autosell_trigger_reason(
+        position_thresholds: AutosellPositionThresholds | TradingPosition,
+        last_price_value: float,
+) -> Optional[AutosellTriggerReason]:
+    if position_thresholds.current_quantity <= 0.0:
+        return None
+
+    stop = position_thresholds.stop_loss_price
+    if stop > 0.0 and last_price_value <= stop:
+        return AutosellTriggerReason.STOP_LOSS
+
+    tp2 = position_thresholds.take_profit_tier_2_price
+    if tp2 > 0.0 and last_price_value >= tp2:
+        return AutosellTriggerReason.TAKE_PROFIT_2
+
+    tp1 = position_thresholds.take_profit_tier_1_price
+    if tp1 > 0.0 and last_price_value >= tp1 and position_thresholds.position_phase == PositionPhase.OPEN:
+        return AutosellTriggerReason.TAKE_PROFIT_1
+
+    return None
+
+
 def _evaluate_position_thresholds(
         database_session: Session,
         position: TradingPosition,
         last_price_value: float,
+        execution_time: datetime,
+        buy_decisions_by_token_address: Optional[dict[str, TradingEvaluation]] = None,
 ) -> List[TradingTrade]:
     created_trades: List[TradingTrade] = []
-    position_quantity = position.current_quantity or 0.0
-
-    if position_quantity <= 0.0:
+    trigger_reason = _determine_autosell_trigger_reason(position, last_price_value)
+    if trigger_reason is None:
         return created_trades
 
-    tp1 = position.take_profit_tier_1_price or 0.0
-    tp2 = position.take_profit_tier_2_price or 0.0
-    stop = position.stop_loss_price or 0.0
+    position_quantity = position.current_quantity
 
-    if stop > 0.0 and last_price_value <= stop:
-        logger.info("[TRADING][AUTOSELL][SL] Triggered for %s @ %.12f (stop=%.12f)", position.token_symbol, last_price_value, stop)
-        trade = _execute_sell_operation(database_session, position, last_price_value, position_quantity, AutosellTriggerReason.STOP_LOSS)
+    if trigger_reason == AutosellTriggerReason.STOP_LOSS:
+        logger.info("[TRADING][AUTOSELL][SL] Triggered for %s @ %.12f (stop=%.12f)", position.token_symbol, last_price_value, position.stop_loss_price)
+        trade = _execute_sell_operation(database_session, position, last_price_value, position_quantity, AutosellTriggerReason.STOP_LOSS, execution_time, buy_decisions_by_token_address)
         if trade:
             created_trades.append(trade)
         return created_trades
 
-    if tp2 > 0.0 and last_price_value >= tp2:
-        logger.info("[TRADING][AUTOSELL][TP2] Triggered for %s @ %.12f (tp2=%.12f)", position.token_symbol, last_price_value, tp2)
-        trade = _execute_sell_operation(database_session, position, last_price_value, position_quantity, AutosellTriggerReason.TAKE_PROFIT_2)
+    if trigger_reason == AutosellTriggerReason.TAKE_PROFIT_2:
+        logger.info("[TRADING][AUTOSELL][TP2] Triggered for %s @ %.12f (tp2=%.12f)", position.token_symbol, last_price_value, position.take_profit_tier_2_price)
+        trade = _execute_sell_operation(database_session, position, last_price_value, position_quantity, AutosellTriggerReason.TAKE_PROFIT_2, execution_time, buy_decisions_by_token_address)
         if trade:
             created_trades.append(trade)
         return created_trades
 
-    if tp1 > 0.0 and last_price_value >= tp1 and position.position_phase == PositionPhase.OPEN:
-        take_profit_fraction = max(0.0, min(1.0, settings.TRADING_TP1_TAKE_PROFIT_FRACTION))
-        partial_quantity = position_quantity * take_profit_fraction
-        if partial_quantity > 0.0:
-            logger.info("[TRADING][AUTOSELL][TP1] Triggered for %s @ %.12f (tp1=%.12f)", position.token_symbol, last_price_value, tp1)
-            trade = _execute_sell_operation(database_session, position, last_price_value, partial_quantity, AutosellTriggerReason.TAKE_PROFIT_1)
-            if trade:
-                created_trades.append(trade)
+    partial_quantity = position_quantity * TAKE_PROFIT_TIER_1_SELL_FRACTION
+    if partial_quantity > 0.0:
+        logger.info("[TRADING][AUTOSELL][TP1] Triggered for %s @ %.12f (tp1=%.12f)", position.token_symbol, last_price_value, position.take_profit_tier_1_price)
+        trade = _execute_sell_operation(database_session, position, last_price_value, partial_quantity, AutosellTriggerReason.TAKE_PROFIT_1, execution_time, buy_decisions_by_token_address)
+        if trade:
+            created_trades.append(trade)
 
     return created_trades
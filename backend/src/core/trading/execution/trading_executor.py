@@ -116,43 +116,19 @@ class TradingExecutor:
 
         if self.paper_mode_enabled:
             logger.info("[TRADING][EXECUTOR][BUY] PAPER trade — %s @ %.12f qty=%.12f", payload.target_token, price_usd, quantity)
-            with get_database_session() as database_session:
-                trade_dao = TradingTradeDao(database_session)
-                position_dao = TradingPositionDao(database_session)
-
-                trading_trade = TradingTrade(
-                    evaluation_id=payload.origin_evaluation_id,
-                    trade_side=TradeSide.BUY,
-                    token_symbol=payload.target_token.symbol,
-                    blockchain_network=payload.target_token.chain,
-                    execution_price=price_usd,
-                    execution_quantity=quantity,
-                    transaction_fee=0.0,
-                    realized_profit_and_loss=None,
-                    execution_status=ExecutionStatus.PAPER,
-                    token_address=payload.target_token.token_address,
-                    pair_address=payload.target_token.pair_address,
-                    dex_id=payload.target_token.dex_id,
-                )
-                trade_dao.save(trading_trade)
-
-                trading_position = TradingPosition(
-                    evaluation_id=payload.origin_evaluation_id,
-                    token_symbol=payload.target_token.symbol,
-                    blockchain_network=payload.target_token.chain,
-                    token_address=payload.target_token.token_address,
-                    pair_address=payload.target_token.pair_address,
-                    open_quantity=quantity,
-                    current_quantity=quantity,
-                    entry_price=price_usd,
-                    take_profit_tier_1_price=take_profit_tp1,
-                    take_profit_tier_2_price=take_profit_tp2,
-                    stop_loss_price=stop_loss,
-                    position_phase=PositionPhase.OPEN,
-                    dex_id=payload.target_token.dex_id,
-                )
-                position_dao.save(trading_position)
-                database_session.commit()
+            self._record_opened_position(
+                token=payload.target_token,
+                blockchain_network=payload.target_token.chain,
+                quantity=quantity,
+                price_usd=price_usd,
+                transaction_fee_usd=0.0,
+                transaction_hash=None,
+                execution_status=ExecutionStatus.PAPER,
+                stop_loss_usd=stop_loss,
+                take_profit_tp1_usd=take_profit_tp1,
+                take_profit_tp2_usd=take_profit_tp2,
+                origin_evaluation_id=payload.origin_evaluation_id,
+            )
 
             invalidate_trading_positions_and_trades_cache()
             return True
@@ -185,6 +161,58 @@ class TradingExecutor:
             logger.exception("[TRADING][EXECUTOR][PRICE] On-chain price fetch failed for %s — %s", token, exception)
             return None
 
+    @staticmethod
+    def _record_opened_position(
+            token: Token,
+            blockchain_network: BlockchainNetwork,
+            quantity: float,
+            price_usd: float,
+            transaction_fee_usd: float,
+            transaction_hash: Optional[str],
+            execution_status: ExecutionStatus,
+            stop_loss_usd: float,
+            take_profit_tp1_usd: float,
+            take_profit_tp2_usd: float,
+            origin_evaluation_id: int,
+    ) -> None:
+        with get_database_session() as database_session:
+            trade_dao = TradingTradeDao(database_session)
+            position_dao = TradingPositionDao(database_session)
+
+            trading_trade = TradingTrade(
+                evaluation_id=origin_evaluation_id,
+                trade_side=TradeSide.BUY,
+                token_symbol=token.symbol,
+                blockchain_network=blockchain_network,
+                execution_price=price_usd,
+                execution_quantity=quantity,
+                transaction_fee=transaction_fee_usd,
+                realized_profit_and_loss=None,
+                execution_status=execution_status,
+                token_address=token.token_address,
+                pair_address=token.pair_address,
+                dex_id=token.dex_id,
+                transaction_hash=transaction_hash,
+            )
+            trade_dao.add_pending(trading_trade)
+
+            trading_position = TradingPosition(
+                evaluation_id=origin_evaluation_id,
+                token_symbol=token.symbol,
+                blockchain_network=blockchain_network,
+                token_address=token.token_address,
+                pair_address=token.pair_address,
+                open_quantity=quantity,
+                current_quantity=quantity,
+                entry_price=price_usd,
+                take_profit_tier_1_price=take_profit_tp1_usd,
+                take_profit_tier_2_price=take_profit_tp2_usd,
+                stop_loss_price=stop_loss_usd,
+                position_phase=PositionPhase.OPEN,
+                dex_id=token.dex_id,
+            )
+            position_dao.add_pending(trading_position)
+
     @staticmethod
     def _is_solana_chain(chain: BlockchainNetwork) -> bool:
         return chain == BlockchainNetwork.SOLANA
@@ -256,45 +284,19 @@ class TradingExecutor:
                 logger.error("[TRADING][EXECUTOR][LIVE][BUY] Missing proper route payload for network %s", network)
                 return False
 
-            with get_database_session() as database_session:
-                trade_dao = TradingTradeDao(database_session)
-                position_dao = TradingPositionDao(database_session)
-
-                trading_trade = TradingTrade(
-                    evaluation_id=origin_evaluation_id,
-                    trade_side=TradeSide.BUY,
-                    token_symbol=token.symbol,
-                    blockchain_network=network,
-                    execution_price=price_usd,
-                    execution_quantity=quantity,
-                    transaction_fee=execution_outcome.transaction_fee_usd,
-                    realized_profit_and_loss=None,
-                    execution_status=ExecutionStatus.LIVE,
-                    token_address=token.token_address,
-                    pair_address=token.pair_address,
-                    dex_id=token.dex_id,
-                    transaction_hash=execution_outcome.transaction_hash_or_signature,
-                )
-                trade_dao.save(trading_trade)
-
-                trading_position = TradingPosition(
-                    evaluation_id=origin_evaluation_id,
-                    token_symbol=token.symbol,
-                    blockchain_network=network,
-                    token_address=token.token_address,
-                    pair_address=token.pair_address,
-                    open_quantity=quantity,
-                    current_quantity=quantity,
-                    entry_price=price_usd,
-                    take_profit_tier_1_price=take_profit_tp1_usd,
-                    take_profit_tier_2_price=take_profit_tp2_usd,
-                    stop_loss_price=stop_loss_usd,
-                    position_phase=PositionPhase.OPEN,
-                    dex_id=token.dex_id,
-                )
-                position_dao.save(trading_position)
-
-                database_session.commit()
+            self._record_opened_position(
+                token=token,
+                blockchain_network=network,
+                quantity=quantity,
+                price_usd=price_usd,
+                transaction_fee_usd=execution_outcome.transaction_fee_usd,
+                transaction_hash=execution_outcome.transaction_hash_or_signature,
+                execution_status=ExecutionStatus.LIVE,
+                stop_loss_usd=stop_loss_usd,
+                take_profit_tp1_usd=take_profit_tp1_usd,
+                take_profit_tp2_usd=take_profit_tp2_usd,
+                origin_evaluation_id=origin_evaluation_id,
+            )
             return True
         except Exception as exception:
             logger.exception("[TRADING][EXECUTOR][LIVE][BUY] Execution failed for %s (%s) — %s", token.symbol, token.token_address, exception)
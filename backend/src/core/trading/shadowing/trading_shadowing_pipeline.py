@@ -1,6 +1,6 @@
 from __future__ import annotations
 
-from datetime import datetime
+from datetime import datetime, timedelta
 
 from src.configuration.config import settings
 from src.core.trading.evaluators.trading_quality_scorer import _evaluate_quality
@@ -13,6 +13,8 @@ from src.persistence.models import TradingShadowingProbe, TradingShadowingVerdic
 
 logger = get_application_logger(__name__)
 
+SHADOW_TOKEN_COOLDOWN_WINDOW = timedelta(minutes=settings.TRADING_SHADOWING_TOKEN_COOLDOWN_MINUTES)
+
 
 class TradingShadowingPipeline:
     def __init__(self) -> None:
@@ -43,14 +45,12 @@ class TradingShadowingPipeline:
         current_time = get_current_local_datetime()
 
         fixed_notional = settings.TRADING_SHADOWING_FIXED_NOTIONAL_USD
-        cooldown_minutes = settings.TRADING_SHADOWING_TOKEN_COOLDOWN_MINUTES
-        shadow_probe_count = 0
+        pending_probes: list[TradingShadowingProbe] = []
         cooldown_skip_count = 0
 
-        from datetime import timedelta
         from src.persistence.dao.trading.shadowing_probe_dao import TradingShadowingProbeDao
 
-        cooldown_threshold = current_time - timedelta(minutes=cooldown_minutes)
+        cooldown_threshold = current_time - SHADOW_TOKEN_COOLDOWN_WINDOW
         token_addresses = [c.dexscreener_token_information.base_token.address for c in candidates]
 
         with get_database_session() as database_session:
@@ -79,7 +79,7 @@ class TradingShadowingPipeline:
             tp2_price = entry_price * (1.0 + settings.TRADING_TP2_EXIT_FRACTION)
             stop_loss_price = entry_price * (1.0 - settings.TRADING_STOP_LOSS_FRACTION)
 
-            self._persist_shadow_probe(
+            pending_probes.append(self._build_shadow_probe(
                 candidate=candidate,
                 rank=rank,
                 notional=fixed_notional,
@@ -87,13 +87,16 @@ class TradingShadowingPipeline:
                 tp2_price=tp2_price,
                 stop_loss_price=stop_loss_price,
                 current_time=current_time,
-            )
+            ))
             cooldown_addresses.add(token_address)
-            shadow_probe_count += 1
+
+        if pending_probes:
+            with get_database_session() as database_session:
+                TradingShadowingProbeDao(database_session).bulk_save(pending_probes)
 
         logger.info(
             "[TRADING][SHADOW][PIPELINE] Recorded %d shadow probes from %d candidates (%d skipped by cooldown)",
-            shadow_probe_count, len(candidates), cooldown_skip_count,
+            len(pending_probes), len(candidates), cooldown_skip_count,
         )
 
     def _filter_allowed_chains(self, candidates: list[TradingCandidate]) -> list[TradingCandidate]:
@@ -106,7 +109,7 @@ class TradingShadowingPipeline:
             logger.debug("[TRADING][SHADOW][PIPELINE] Chain filter retained %d / %d", len(retained), len(candidates))
         return retained
 
-    def _persist_shadow_probe(
+    def _build_shadow_probe(
             self,
             candidate: TradingCandidate,
             rank: int,
@@ -115,7 +118,7 @@ class TradingShadowingPipeline:
             tp2_price: float,
             stop_loss_price: float,
             current_time: datetime,
-    ) -> None:
+    ) -> TradingShadowingProbe:
         token_information = candidate.dexscreener_token_information
         base_token = token_information.base_token
         volume = token_information.volume
@@ -160,10 +163,8 @@ class TradingShadowingPipeline:
             stop_loss_price=stop_loss_price,
         )
 
-        with get_database_session() as database_session:
-            database_session.add(probe)
-
-        logger.debug("[TRADING][SHADOW][PERSIST] Recorded shadow probe for %s at price %.10f", base_token.symbol, token_information.price_usd or 0.0)
+        logger.debug("[TRADING][SHADOW][PERSIST] Prepared shadow probe for %s at price %.10f", base_token.symbol, token_information.price_usd or 0.0)
+        return probe
 
     def _compute_buy_to_sell_ratio(self, transactions) -> float:
         if not transactions or not (transactions.h1 or transactions.h24):
@@ -4,6 +4,8 @@ from collections import defaultdict
 from datetime import datetime, timedelta
 from typing import Optional, Iterable
 
+from sqlalchemy import Row
+
 from src.configuration.config import settings
 from src.core.trading.shadowing.trading_shadowing_structures import (
     TradingShadowingVerdictChronicleBucketConfiguration,
@@ -22,7 +24,6 @@ from src.core.utils.date_utils import (
 from src.logging.logger import get_application_logger
 from src.persistence.dao.trading.shadowing_verdict_dao import TradingShadowingVerdictDao
 from src.persistence.db import get_database_session
-from src.persistence.models import TradingShadowingVerdict
 
 logger = get_application_logger(__name__)
 
@@ -36,12 +37,12 @@ def compute_shadow_verdict_chronicle() -> TradingShadowingVerdictChronicleComput
 
     with get_database_session() as database_session:
         verdict_dao = TradingShadowingVerdictDao(database_session)
-        resolved_verdicts = verdict_dao.retrieve_resolved_in_window(
+        resolved_verdict_rows = verdict_dao.stream_resolved_in_window(
             start_datetime=global_from_datetime,
             end_datetime=fetch_end_datetime,
             limit_count=settings.TRADING_SHADOWING_HISTORY_MAX_VERDICTS_FETCH,
         )
-        verdicts = _convert_verdicts(resolved_verdicts)
+        verdicts = _convert_verdicts(resolved_verdict_rows)
 
     logger.info(
         "[TRADING][SHADOW][HISTORY] Full chronicle built — verdict_count=%d bucket_layer_count=%d",
@@ -76,13 +77,13 @@ def compute_shadow_verdict_chronicle_incremental(
     new_verdicts: list[TradingShadowingVerdictChronicleVerdict] = []
     with get_database_session() as database_session:
         verdict_dao = TradingShadowingVerdictDao(database_session)
-        new_orms = verdict_dao.retrieve_resolved_in_window_after_id(
+        new_verdict_rows = verdict_dao.retrieve_resolved_in_window_after_id(
             after_id_exclusive=max_id,
             start_datetime=global_from_datetime,
             end_datetime=fetch_end_datetime,
             limit_count=settings.TRADING_SHADOWING_HISTORY_MAX_VERDICTS_FETCH,
         )
-        new_verdicts = _convert_verdicts(new_orms)
+        new_verdicts = _convert_verdicts(new_verdict_rows)
 
     if new_verdicts:
         merged_by_id = {chronicle_verdict.id: chronicle_verdict for chronicle_verdict in working_verdicts}
@@ -151,18 +152,12 @@ def _build_bucket(
         from_datetime: datetime,
         to_datetime: datetime,
 ) -> TradingShadowingVerdictChronicleBucket:
-    window_from = ensure_timezone_aware(from_datetime)
-    window_to = ensure_timezone_aware(to_datetime)
-    assert window_from is not None and window_to is not None
-
     grouped_verdicts: dict[int, list[TradingShadowingVerdictChronicleVerdict]] = defaultdict(list)
     bounded_verdicts: list[TradingShadowingVerdictChronicleVerdict] = []
 
     for verdict in verdicts:
-        resolved_at = ensure_timezone_aware(verdict.resolved_at)
-        if resolved_at is None:
-            continue
-        if resolved_at < window_from or resolved_at > window_to:
+        resolved_at = verdict.resolved_at
+        if resolved_at < from_datetime or resolved_at > to_datetime:
             continue
         bounded_verdicts.append(verdict)
         bucket_start = _floor_datetime_to_granularity(resolved_at, bucket_configuration.granularity_seconds)
@@ -177,17 +172,24 @@ def _build_bucket(
         if verdict_count == 0:
             continue
 
-        pnl_usd_values = [item.realized_pnl_usd for item in items]
-        pnl_percentage_values = [item.realized_pnl_percentage for item in items]
-        win_count = sum(1 for item in items if item.is_profitable)
-        gross_profit_usd = sum(value for value in pnl_usd_values if value > 0.0)
-        gross_loss_usd = abs(sum(value for value in pnl_usd_values if value < 0.0))
+        total_pnl_usd = 0.0
+        total_pnl_percentage = 0.0
+        gross_profit_usd = 0.0
+        gross_loss_usd = 0.0
+        win_count = 0
+        for item in items:
+            realized_pnl_usd = item.realized_pnl_usd
+            total_pnl_usd += realized_pnl_usd
+            total_pnl_percentage += item.realized_pnl_percentage
+            gross_profit_usd += max(realized_pnl_usd, 0.0)
+            gross_loss_usd += max(-realized_pnl_usd, 0.0)
+            win_count += item.is_profitable
 
         metric_points.append(TradingShadowingVerdictChronicleMetricPoint(
             timestamp_milliseconds=bucket_timestamp,
-            average_pnl_percentage=sum(pnl_percentage_values) / verdict_count,
+            average_pnl_percentage=total_pnl_percentage / verdict_count,
             average_win_rate_percentage=(win_count / verdict_count) * 100.0,
-            expected_value_per_trade_usd=sum(pnl_usd_values) / verdict_count,
+            expected_value_per_trade_usd=total_pnl_usd / verdict_count,
             capital_velocity_per_hour=_compute_velocity_per_hour(verdict_count, bucket_configuration.granularity_seconds),
             profit_factor=_compute_profit_factor(gross_profit_usd, gross_loss_usd),
         ))
@@ -229,25 +231,23 @@ def _build_bucket(
 
 
 def _convert_shadow_verdict_to_chronicle_verdict(
-        verdict: TradingShadowingVerdict,
+        resolved_verdict_row: Row,
 ) -> Optional[TradingShadowingVerdictChronicleVerdict]:
-    resolved_at = ensure_timezone_aware(verdict.resolved_at)
+    resolved_at = ensure_timezone_aware(resolved_verdict_row.resolved_at)
     if resolved_at is None:
         return None
-    if verdict.realized_pnl_percentage is None or verdict.realized_pnl_usd is None:
-        return None
-    if verdict.is_profitable is None:
+    if resolved_verdict_row.realized_pnl_percentage is None or resolved_verdict_row.realized_pnl_usd is None:
         return None
-    if verdict.probe is None:
+    if resolved_verdict_row.is_profitable is None:
         return None
     return TradingShadowingVerdictChronicleVerdict(
-        id=verdict.id,
+        id=resolved_verdict_row.id,
         resolved_at=resolved_at,
-        realized_pnl_percentage=verdict.realized_pnl_percentage,
-        realized_pnl_usd=verdict.realized_pnl_usd,
-        is_profitable=bool(verdict.is_profitable),
-        exit_reason=verdict.exit_reason or "UNRESOLVED",
-        order_notional_value_usd=verdict.probe.order_notional_value_usd,
+        realized_pnl_percentage=resolved_verdict_row.realized_pnl_percentage,
+        realized_pnl_usd=resolved_verdict_row.realized_pnl_usd,
+        is_profitable=bool(resolved_verdict_row.is_profitable),
+        exit_reason=resolved_verdict_row.exit_reason or "UNRESOLVED",
+        order_notional_value_usd=resolved_verdict_row.order_notional_value_usd,
     )
 
 
@@ -281,10 +281,10 @@ def _verdict_fetch_end_datetime(
     return series_end_datetime + timedelta(seconds=max_granularity_seconds * trailing)
 
 
-def _convert_verdicts(verdicts: list[TradingShadowingVerdict]) -> list[TradingShadowingVerdictChronicleVerdict]:
+def _convert_verdicts(resolved_verdict_rows: Iterable[Row]) -> list[TradingShadowingVerdictChronicleVerdict]:
     chronicle_verdicts: list[TradingShadowingVerdictChronicleVerdict] = []
-    for verdict in verdicts:
-        chronicle_verdict = _convert_shadow_verdict_to_chronicle_verdict(verdict)
+    for resolved_verdict_row in resolved_verdict_rows:
+        chronicle_verdict = _convert_shadow_verdict_to_chronicle_verdict(resolved_verdict_row)
         if chronicle_verdict is not None:
             chronicle_verdicts.append(chronicle_verdict)
     return chronicle_verdicts
@@ -296,18 +296,11 @@ def _trim_verdicts_for_window(
         fetch_end_datetime: datetime,
         max_count: int,
 ) -> list[TradingShadowingVerdictChronicleVerdict]:
-    window_from = ensure_timezone_aware(global_from_datetime)
-    window_to = ensure_timezone_aware(fetch_end_datetime)
-    assert window_from is not None and window_to is not None
-
-    filtered: list[TradingShadowingVerdictChronicleVerdict] = []
-    for chronicle_verdict in verdicts:
-        resolved_at = ensure_timezone_aware(chronicle_verdict.resolved_at)
-        if resolved_at is None:
-            continue
-        if resolved_at < window_from or resolved_at > window_to:
-            continue
-        filtered.append(chronicle_verdict)
+    filtered: list[TradingShadowingVerdictChronicleVerdict] = [
+        chronicle_verdict
+        for chronicle_verdict in verdicts
+        if global_from_datetime <= chronicle_verdict.resolved_at <= fetch_end_datetime
+    ]
     filtered.sort(key=lambda chronicle_verdict: chronicle_verdict.resolved_at)
     if len(filtered) <= max_count:
         return filtered
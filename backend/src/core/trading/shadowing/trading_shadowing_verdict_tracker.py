@@ -72,7 +72,7 @@ class TradingShadowingVerdictTracker:
                 resolution_tokens = [
                     Token(
                         symbol=verdict.probe.token_symbol,
-                        chain=BlockchainNetwork(verdict.probe.blockchain_network.lower()),
+                        chain=BlockchainNetwork(verdict.probe.blockchain_network),
                         token_address=verdict.probe.token_address,
                         pair_address=verdict.probe.pair_address,
                         dex_id=verdict.probe.dex_id,
@@ -227,7 +227,7 @@ class TradingShadowingVerdictTracker:
             processed_keys.add(price_key)
             unique_tokens.append(Token(
                 symbol=probe.token_symbol,
-                chain=BlockchainNetwork(probe.blockchain_network.lower()),
+                chain=BlockchainNetwork(probe.blockchain_network),
                 token_address=probe.token_address,
                 pair_address=probe.pair_address,
                 dex_id=probe.dex_id,
@@ -1,5 +1,6 @@
 from __future__ import annotations
 
+import logging
 import math
 
 from src.configuration.config import settings
@@ -151,7 +152,7 @@ class TradingPipeline:
     def _step_fetch_candidates(self) -> list[TradingCandidate]:
         candidates = fetch_trading_candidates_sync()
         logger.info("[TRADING][PIPELINE][FETCH] Fetched %d raw candidates", len(candidates))
-        if candidates:
+        if candidates and logger.isEnabledFor(logging.DEBUG):
             symbols = [candidate.token.symbol for candidate in candidates]
             logger.debug("[TRADING][PIPELINE][FETCH] Candidates: %s", ", ".join(symbols))
         return candidates
@@ -318,26 +319,32 @@ class TradingPipeline:
         apply_shadowing_notional_boost(candidates, shadow_snapshot)
 
     def _step_execute(self, candidates: list[TradingCandidate], pipeline_context: TradingPipelineContext) -> None:
-        from sqlalchemy import select, func
+        from sqlalchemy import select, func, desc
         from src.persistence.db import get_database_session
-        from src.persistence.models import TradingPosition, PositionPhase
-        from src.persistence.dao.trading.trading_portfolio_snapshot_dao import TradingPortfolioSnapshotDao
+        from src.persistence.models import TradingPosition, TradingPortfolioSnapshot, PositionPhase
+
+        execution_capacity_query = select(
+            select(func.count(TradingPosition.id))
+            .where(TradingPosition.position_phase.in_([PositionPhase.OPEN, PositionPhase.PARTIAL]))
+            .scalar_subquery()
+            .label("open_position_count"),
+            select(TradingPortfolioSnapshot.total_equity_value)
+            .order_by(desc(TradingPortfolioSnapshot.created_at))
+            .limit(1)
+            .scalar_subquery()
+            .label("latest_total_equity_value"),
+        )
 
         with get_database_session() as database_session:
-            current_open_count = database_session.execute(
-                select(func.count(TradingPosition.id))
-                .where(TradingPosition.position_phase.in_([PositionPhase.OPEN, PositionPhase.PARTIAL]))
-            ).scalar_one_or_none() or 0
-
-            portfolio_dao = TradingPortfolioSnapshotDao(database_session)
-            latest_snapshot = portfolio_dao.retrieve_latest_snapshot()
-            if not latest_snapshot:
-                logger.info("[TRADING][PIPELINE][EXECUTE] No trading portfolio snapshot found")
-                for rank, candidate in enumerate(candidates, start=1):
-                    TradingEvaluationRecorder.persist_and_broadcast_skip(candidate, rank, "NO_PORTFOLIO_SNAPSHOT")
-                return
-            else:
-                total_equity_usd = latest_snapshot.total_equity_value
+            execution_capacity = database_session.execute(execution_capacity_query).one()
+
+        current_open_count = execution_capacity.open_position_count or 0
+        if execution_capacity.latest_total_equity_value is None:
+            logger.info("[TRADING][PIPELINE][EXECUTE] No trading portfolio snapshot found")
+            for rank, candidate in enumerate(candidates, start=1):
+                TradingEvaluationRecorder.persist_and_broadcast_skip(candidate, rank, "NO_PORTFOLIO_SNAPSHOT")
+            return
+        total_equity_usd = execution_capacity.latest_total_equity_value
 
         from src.core.trading.cache.trading_cache import trading_cache
         available_cash_usd = trading_cache.get_available_cash_usd()
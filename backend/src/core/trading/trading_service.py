@@ -1,9 +1,10 @@
 from __future__ import annotations
 
-from collections import defaultdict, deque
+import math
+from collections import defaultdict
 from datetime import datetime, timedelta
-from decimal import Decimal
-from typing import Iterable, List, Dict, Deque, Optional
+from operator import itemgetter
+from typing import Iterable, List, Dict, Optional, Set
 
 from sqlalchemy.orm import Session
 
@@ -11,33 +12,47 @@ from src.api.http.api_schemas import TradingTradePayload
 from src.cache.cache_invalidator import cache_invalidator
 from src.cache.cache_realm import CacheRealm
 from src.configuration.config import settings
-from src.core.structures.structures import RealizedProfitAndLoss, Token, CashFromTrades
-from src.core.trading.trading_structures import InventoryLot, TradingCandidate
+from src.core.structures.structures import RealizedProfitAndLoss, Token, CashFromTrades, TradeCashFlowTotals
+from src.core.trading.trading_structures import InventoryLot, InventoryLotConsumption, InventoryLotQueue, RealizedProfitAndLossContribution, TradingCandidate
 from src.core.trading.trading_utils import normalize_side_to_upper, run_awaitable_in_fresh_loop, candidate_from_dexscreener_token_information, logger
 from src.core.utils.date_utils import get_current_local_datetime, parse_iso_datetime_to_local
 from src.core.utils.math_utils import quantize_2dp, decimal_from_primitive
 from src.integrations.dexscreener.dexscreener_structures import DexscreenerTokenInformation
 from src.logging.logger import get_application_logger
-from src.persistence.models import TradingTrade
 
 logger = get_application_logger(__name__)
 
 
-def compute_realized_profit_and_loss(trades: Iterable[TradingTradePayload], *, cutoff_hours: int = 24) -> RealizedProfitAndLoss:
-    cutoff_timestamp = get_current_local_datetime() - timedelta(hours=cutoff_hours)
+_realized_contributions_memo: tuple[tuple[TradingTradePayload, ...], List[RealizedProfitAndLossContribution]] = ((), [])
+_committed_cash_flow_totals_memo: tuple[Optional[int], TradeCashFlowTotals] = (None, TradeCashFlowTotals(total_buy_volume=0.0, total_sell_volume=0.0, total_fees_paid=0.0))
 
-    def trade_timestamp(trade: TradingTradePayload) -> datetime:
-        return parse_iso_datetime_to_local(trade.created_at)
 
-    sorted_trades: List[TradingTradePayload] = sorted(trades, key=trade_timestamp)
+def compute_realized_profit_and_loss(trades: Iterable[TradingTradePayload], *, cutoff_hours: int = 24) -> RealizedProfitAndLoss:
+    global _realized_contributions_memo
+
+    cutoff_timestamp = get_current_local_datetime() - timedelta(hours=cutoff_hours)
+    trades_snapshot = tuple(trades)
+    memoized_trades, contributions = _realized_contributions_memo
+    if trades_snapshot != memoized_trades:
+        contributions = _compute_realized_contributions(trades_snapshot)
+        _realized_contributions_memo = (trades_snapshot, contributions)
+
+    realized_total = decimal_from_primitive(math.fsum(contribution.realized_profit_and_loss for contribution in contributions))
+    realized_recent = decimal_from_primitive(math.fsum(
+        contribution.realized_profit_and_loss
+        for contribution in contributions
+        if contribution.realized_at >= cutoff_timestamp
+    ))
+
+    return RealizedProfitAndLoss(
+        total_realized_profit_and_loss=float(quantize_2dp(realized_total)),
+        recent_realized_profit_and_loss=float(quantize_2dp(realized_recent)),
+    )
 
-    lots_by_token: Dict[Token, Deque[InventoryLot]] = defaultdict(deque)
-    realized_total: Decimal = Decimal("0")
-    realized_recent: Decimal = Decimal("0")
 
-    for trade in sorted_trades:
-        side = normalize_side_to_upper(trade.trade_side)
-        token = Token(
+def _compute_realized_contributions(trades: tuple[TradingTradePayload, ...]) -> List[RealizedProfitAndLossContribution]:
+    def build_inventory_token(trade: TradingTradePayload) -> Token:
+        return Token(
             symbol=trade.token_symbol,
             chain=trade.blockchain_network,
             token_address=trade.token_address,
@@ -45,69 +60,82 @@ def compute_realized_profit_and_loss(trades: Iterable[TradingTradePayload], *, c
             dex_id=trade.dex_id,
         )
 
-        try:
-            quantity = float(trade.execution_quantity) if trade.execution_quantity is not None else 0.0
-            unit_price_usd = float(trade.execution_price) if trade.execution_price is not None else 0.0
-            fee_usd = float(trade.transaction_fee) if trade.transaction_fee is not None else 0.0
-        except (TypeError, ValueError):
-            logger.debug("[PNL][REALIZED][SKIP] token=%s reason=invalid_numeric_fields", token)
-            continue
-
+    timestamped_trades: List[tuple[datetime, bool, TradingTradePayload]] = sorted(
+        ((parse_iso_datetime_to_local(trade.created_at), normalize_side_to_upper(trade.trade_side) == "SELL", trade) for trade in trades),
+        key=itemgetter(0),
+    )
+    tokens_requiring_lot_matching: Set[Token] = {
+        build_inventory_token(trade)
+        for _, is_sell, trade in timestamped_trades
+        if is_sell and trade.realized_profit_and_loss is None
+    }
+    if not tokens_requiring_lot_matching:
+        return [
+            RealizedProfitAndLossContribution(realized_at=traded_at, realized_profit_and_loss=trade.realized_profit_and_loss)
+            for traded_at, is_sell, trade in timestamped_trades
+            if is_sell and trade.realized_profit_and_loss is not None and trade.execution_quantity > 0.0 and trade.execution_price > 0.0
+        ]
+    token_addresses_requiring_lot_matching: Set[str] = {token.token_address for token in tokens_requiring_lot_matching}
+
+    lot_queues_by_token: Dict[Token, InventoryLotQueue] = defaultdict(InventoryLotQueue)
+    open_lot_quantity_by_token: Dict[Token, float] = defaultdict(float)
+    deferred_consumed_quantity_by_token: Dict[Token, float] = defaultdict(float)
+    contributions: List[RealizedProfitAndLossContribution] = []
+
+    for traded_at, is_sell, trade in timestamped_trades:
+        quantity = trade.execution_quantity
+        unit_price_usd = trade.execution_price
         if quantity <= 0.0 or unit_price_usd <= 0.0:
-            logger.debug("[PNL][REALIZED][SKIP] token=%s reason=non_positive_qty_or_price", token)
+            logger.debug("[PNL][REALIZED][SKIP] token=%s reason=non_positive_qty_or_price", trade.token_symbol)
             continue
 
-        if side == "BUY":
-            buy_fee_per_unit_usd = fee_usd / quantity if quantity > 0.0 else 0.0
-            lots_by_token[token].append(
-                InventoryLot(quantity=quantity, unit_price_usd=unit_price_usd,
-                             buy_fee_per_unit_usd=buy_fee_per_unit_usd)
+        token: Optional[Token] = None
+        if trade.token_address in token_addresses_requiring_lot_matching:
+            inventory_token = build_inventory_token(trade)
+            if inventory_token in tokens_requiring_lot_matching:
+                token = inventory_token
+
+        if not is_sell:
+            if token is None:
+                continue
+            lot_queues_by_token[token].lots.append(
+                InventoryLot(quantity=quantity, unit_cost_basis_usd=unit_price_usd + trade.transaction_fee / quantity)
             )
+            open_lot_quantity_by_token[token] += quantity
             continue
 
-        if side == "SELL" and trade.realized_profit_and_loss is not None:
-            is_recent = trade_timestamp(trade) >= cutoff_timestamp
-            usd_contribution = decimal_from_primitive(trade.realized_profit_and_loss)
-            realized_total += usd_contribution
-            if is_recent:
-                realized_recent += usd_contribution
-            remaining_to_match = quantity
-            while remaining_to_match > 1e-12 and lots_by_token[token]:
-                lot = lots_by_token[token][0]
-                matched_quantity = min(remaining_to_match, lot.quantity)
-                lot.quantity -= matched_quantity
-                remaining_to_match -= matched_quantity
-                if lot.quantity <= 1e-12:
-                    lots_by_token[token].popleft()
+        if trade.realized_profit_and_loss is not None:
+            contributions.append(RealizedProfitAndLossContribution(
+                realized_at=traded_at,
+                realized_profit_and_loss=trade.realized_profit_and_loss,
+            ))
+            if token is None:
+                continue
+            deferred_consumed_quantity = deferred_consumed_quantity_by_token[token]
+            unclaimed_lot_quantity = max(open_lot_quantity_by_token[token] - deferred_consumed_quantity, 0.0)
+            deferred_consumed_quantity_by_token[token] = deferred_consumed_quantity + min(quantity, unclaimed_lot_quantity)
             continue
 
-        if side == "SELL":
-            sell_fee_per_unit_usd = fee_usd / quantity if quantity > 0.0 else 0.0
-            remaining_to_match = quantity
-            is_recent = trade_timestamp(trade) >= cutoff_timestamp
-
-            while remaining_to_match > 1e-12 and lots_by_token[token]:
-                lot = lots_by_token[token][0]
-                matched_quantity = min(remaining_to_match, lot.quantity)
+        net_sell_price_usd = unit_price_usd - trade.transaction_fee / quantity
 
-                pnl_per_unit = unit_price_usd - lot.unit_price_usd - lot.buy_fee_per_unit_usd - sell_fee_per_unit_usd
-                pnl_contribution = decimal_from_primitive(matched_quantity) * decimal_from_primitive(pnl_per_unit)
+        inventory_lot_queue = lot_queues_by_token[token]
+        deferred_consumed_quantity = deferred_consumed_quantity_by_token.pop(token, 0.0)
+        if deferred_consumed_quantity > 0.0:
+            deferred_consumption = _consume_inventory_lots(inventory_lot_queue, deferred_consumed_quantity)
+            open_lot_quantity_by_token[token] -= deferred_consumption.matched_quantity
 
-                realized_total += pnl_contribution
-                if is_recent:
-                    realized_recent += pnl_contribution
-
-                lot.quantity -= matched_quantity
-                remaining_to_match -= matched_quantity
-                if lot.quantity <= 1e-12:
-                    lots_by_token[token].popleft()
+        lot_consumption = _consume_inventory_lots(inventory_lot_queue, quantity)
+        open_lot_quantity_by_token[token] -= lot_consumption.matched_quantity
+        if lot_consumption.matched_quantity <= 0.0:
+            continue
 
-    realized = RealizedProfitAndLoss(
-        total_realized_profit_and_loss=float(quantize_2dp(realized_total)),
-        recent_realized_profit_and_loss=float(quantize_2dp(realized_recent)),
-    )
+        sell_proceeds_usd = lot_consumption.matched_quantity * net_sell_price_usd
+        contributions.append(RealizedProfitAndLossContribution(
+            realized_at=traded_at,
+            realized_profit_and_loss=sell_proceeds_usd - lot_consumption.matched_cost_basis_usd,
+        ))
 
-    return realized
+    return contributions
 
 
 def compute_available_cash_usd(*, database_session: Optional[Session] = None) -> float:
@@ -118,43 +146,18 @@ def compute_available_cash_usd(*, database_session: Optional[Session] = None) ->
     return _compute_live_available_cash_usd()
 
 
-def compute_cash_from_trades(start_cash_usd: float, trades: Iterable[TradingTrade]) -> CashFromTrades:
-    sorted_trades: List[TradingTrade] = list(trades)
-
-    total_buys: Decimal = Decimal("0")
-    total_sells: Decimal = Decimal("0")
-    total_fees: Decimal = Decimal("0")
-
-    for trade in sorted_trades:
-        side = normalize_side_to_upper(trade.trade_side)
-
-        try:
-            quantity = float(trade.execution_quantity) if trade.execution_quantity is not None else 0.0
-            unit_price_usd = float(trade.execution_price) if trade.execution_price is not None else 0.0
-            fee_usd_dec = decimal_from_primitive(trade.transaction_fee)
-        except (TypeError, ValueError):
-            logger.debug("[PNL][CASH][SKIP] reason=invalid_numeric_fields")
-            continue
-
-        if quantity <= 0.0 or unit_price_usd <= 0.0:
-            logger.debug("[PNL][CASH][SKIP] reason=non_positive_qty_or_price")
-            continue
-
-        notional_dec = decimal_from_primitive(unit_price_usd * quantity)
-        if side == "BUY":
-            total_buys += notional_dec
-        elif side == "SELL":
-            total_sells += notional_dec
-        total_fees += fee_usd_dec
+def compute_cash_from_trade_totals(start_cash_usd: float, cash_flow_totals: TradeCashFlowTotals) -> CashFromTrades:
+    total_buys = decimal_from_primitive(cash_flow_totals.total_buy_volume)
+    total_sells = decimal_from_primitive(cash_flow_totals.total_sell_volume)
+    total_fees = decimal_from_primitive(cash_flow_totals.total_fees_paid)
 
     ending_cash = decimal_from_primitive(start_cash_usd) - total_buys + total_sells - total_fees
-    result = CashFromTrades(
+    return CashFromTrades(
         available_cash=float(quantize_2dp(ending_cash)),
         total_buy_volume=float(quantize_2dp(total_buys)),
         total_sell_volume=float(quantize_2dp(total_sells)),
         total_fees_paid=float(quantize_2dp(total_fees)),
     )
-    return result
 
 
 def fetch_trading_candidates_sync() -> list[TradingCandidate]:
@@ -174,12 +177,18 @@ def invalidate_trading_positions_and_trades_cache() -> None:
     logger.debug("[TRADING][SERVICE] Positions and trades cache realms marked dirty after persisted mutation")
 
 
+def invalidate_committed_cash_flow_totals_memo() -> None:
+    global _committed_cash_flow_totals_memo
+    _committed_cash_flow_totals_memo = (None, TradeCashFlowTotals(total_buy_volume=0.0, total_sell_volume=0.0, total_fees_paid=0.0))
+    logger.debug("[TRADING][SERVICE] Committed cash flow totals memo cleared after trade history reset")
+
+
 def _paper_available_cash_from_trades(database_session: Session, starting_cash_usd: float) -> float:
     from src.persistence.dao.trading.trading_trade_dao import TradingTradeDao
 
     trade_dao = TradingTradeDao(database_session)
-    all_trades = trade_dao.retrieve_recent_trades(limit_count=100000)
-    cash_state = compute_cash_from_trades(starting_cash_usd, all_trades)
+    cash_flow_totals = trade_dao.retrieve_cash_flow_totals()
+    cash_state = compute_cash_from_trade_totals(starting_cash_usd, cash_flow_totals)
     return cash_state.available_cash
 
 
@@ -202,7 +211,40 @@ def _compute_live_available_cash_usd() -> float:
 
 
 def _compute_paper_available_cash_usd(starting_cash_usd: float) -> float:
+    global _committed_cash_flow_totals_memo
+    from src.persistence.dao.trading.trading_trade_dao import TradingTradeDao
     from src.persistence.db import get_database_session
 
     with get_database_session() as database_session:
-        return _paper_available_cash_from_trades(database_session, starting_cash_usd)
+        trade_dao = TradingTradeDao(database_session)
+        latest_trade_id = trade_dao.retrieve_latest_trade_id()
+        memoized_latest_trade_id, cash_flow_totals = _committed_cash_flow_totals_memo
+        if latest_trade_id is None or latest_trade_id != memoized_latest_trade_id:
+            cash_flow_totals = trade_dao.retrieve_cash_flow_totals()
+            _committed_cash_flow_totals_memo = (latest_trade_id, cash_flow_totals)
+    return compute_cash_from_trade_totals(starting_cash_usd, cash_flow_totals).available_cash
+
+
+def _consume_inventory_lots(inventory_lot_queue: InventoryLotQueue, quantity: float) -> InventoryLotConsumption:
+    inventory_lots = inventory_lot_queue.lots
+    lot_count = len(inventory_lots)
+    head_lot_index = inventory_lot_queue.head_lot_index
+    remaining_to_match = quantity
+    matched_cost_basis_usd = 0.0
+    while remaining_to_match > 1e-12 and head_lot_index < lot_count:
+        lot = inventory_lots[head_lot_index]
+        if lot.quantity <= remaining_to_match:
+            head_lot_index += 1
+            matched_cost_basis_usd += lot.quantity * lot.unit_cost_basis_usd
+            remaining_to_match -= lot.quantity
+            continue
+        matched_cost_basis_usd += remaining_to_match * lot.unit_cost_basis_usd
+        lot.quantity -= remaining_to_match
+        remaining_to_match = 0.0
+        if lot.quantity <= 1e-12:
+            head_lot_index += 1
+    inventory_lot_queue.head_lot_index = head_lot_index
+    return InventoryLotConsumption(
+        matched_quantity=quantity - remaining_to_match,
+        matched_cost_basis_usd=matched_cost_basis_usd,
+    )
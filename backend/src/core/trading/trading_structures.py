@@ -1,11 +1,13 @@
 from __future__ import annotations
 
 import enum
-from dataclasses import dataclass
+from dataclasses import dataclass, field
+from datetime import datetime
 from typing import Optional, List
 
 from pydantic import BaseModel
 
+from src.core.structures.structures import PositionPhase
 from src.core.trading.shadowing.trading_shadowing_structures import ShadowIntelligenceSnapshotPayload
 from src.integrations.dexscreener.dexscreener_structures import DexscreenerTokenInformation
 
@@ -16,6 +18,17 @@ class AutosellTriggerReason(str, enum.Enum):
     STOP_LOSS = "STOP_LOSS"
 
 
+class AutosellPositionThresholds(BaseModel):
+    position_id: int
+    token_symbol: str
+    pair_address: str
+    position_phase: PositionPhase
+    current_quantity: float
+    take_profit_tier_1_price: float
+    take_profit_tier_2_price: float
+    stop_loss_price: float
+
+
 class TradingFilterVerdict(BaseModel):
     is_accepted: bool
     rejection_reasons: List[str]
@@ -157,11 +170,28 @@ class TradingPipelineContext(BaseModel):
         arbitrary_types_allowed = True
 
 
-@dataclass
+@dataclass(slots=True)
 class InventoryLot:
     quantity: float
-    unit_price_usd: float
-    buy_fee_per_unit_usd: float
+    unit_cost_basis_usd: float
+
+
+@dataclass(slots=True)
+class InventoryLotQueue:
+    lots: List[InventoryLot] = field(default_factory=list)
+    head_lot_index: int = 0
+
+
+@dataclass(slots=True)
+class InventoryLotConsumption:
+    matched_quantity: float
+    matched_cost_basis_usd: float
+
+
+@dataclass
+class RealizedProfitAndLossContribution:
+    realized_at: datetime
+    realized_profit_and_loss: float
 
 
 from src.core.structures.structures import Token
@@ -9,7 +9,6 @@ from src.core.structures.structures import Token, BlockchainNetwork
 from src.core.trading.trading_structures import TradingCandidate
 from src.integrations.dexscreener.dexscreener_structures import DexscreenerTokenInformation
 from src.logging.logger import get_application_logger
-from src.persistence.models import TradingPosition
 
 logger = get_application_logger(__name__)
 
@@ -92,7 +91,7 @@ def preload_best_prices(candidates: list[TradingCandidate]) -> list[DexscreenerT
     return fetch_dexscreener_token_information_list_sync(unique_tokens)
 
 
-def is_address_in_open_positions(candidate_address: str, open_position_addresses: set[str]) -> bool:
+def is_address_in_open_positions(candidate_address: str, open_position_addresses: frozenset[str]) -> bool:
     return bool(candidate_address) and candidate_address in open_position_addresses
 
 
@@ -137,18 +136,6 @@ def run_awaitable_in_fresh_loop(asynchronous_task: Awaitable[U], debug_label: st
         return task_result_container["result"]
 
 
-def convert_trading_position_to_token(position: TradingPosition) -> Token:
-    pair_address: Optional[str] = position.pair_address if isinstance(position.pair_address,
-                                                                      str) and position.pair_address else None
-    return Token(
-        chain=position.blockchain_network,
-        token_address=position.token_address,
-        symbol=position.token_symbol,
-        pair_address=pair_address,
-        dex_id=position.dex_id,
-    )
-
-
 def normalize_side_to_upper(value: str | Enum | None) -> str:
     if value is None:
         return ""
@@ -1,6 +1,7 @@
 from __future__ import annotations
 
 import asyncio
+import logging
 from datetime import datetime
 from typing import List
 
@@ -94,11 +95,12 @@ async def fetch_bulk_historical_candlesticks(
                     "limit": 1000
                 }
 
-                logger.debug(
-                    "[BINANCE][CLIENT][BULK_HISTORY] Fetching chunk for %s starting at %s",
-                    symbol,
-                    convert_epoch_to_local_datetime(current_start_time_milliseconds).astimezone(tz=start_time.tzinfo).isoformat()
-                )
+                if logger.isEnabledFor(logging.DEBUG):
+                    logger.debug(
+                        "[BINANCE][CLIENT][BULK_HISTORY] Fetching chunk for %s starting at %s",
+                        symbol,
+                        convert_epoch_to_local_datetime(current_start_time_milliseconds).astimezone(tz=start_time.tzinfo).isoformat()
+                    )
 
                 response = await client.get(url, params=query_parameters, timeout=15.0)
                 response.raise_for_status()
@@ -10,6 +10,7 @@ from src.logging.logger import get_application_logger
 logger = get_application_logger(__name__)
 
 from src.core.structures.structures import BlockchainNetwork
+import threading
 import time
 
 FREE_RPC_ENDPOINTS: dict[BlockchainNetwork, list[str]] = {
@@ -38,18 +39,22 @@ _resolved_web3_provider_cache: dict[BlockchainNetwork, Web3] = {}
 _resolved_async_web3_provider_cache: dict[BlockchainNetwork, AsyncWeb3] = {}
 _resolved_rpc_url_cache: dict[BlockchainNetwork, str] = {}
 _blacklisted_rpc_urls: dict[str, float] = {}
+_blacklisted_rpc_urls_lock = threading.Lock()
 
 
 def _is_rpc_url_blacklisted(rpc_url: str) -> bool:
-    blacklist_timestamp = _blacklisted_rpc_urls.get(rpc_url)
-    if blacklist_timestamp is None:
+    if rpc_url not in _blacklisted_rpc_urls:
         return False
 
-    if time.time() - blacklist_timestamp > 5:
-        del _blacklisted_rpc_urls[rpc_url]
-        return False
+    with _blacklisted_rpc_urls_lock:
+        if rpc_url not in _blacklisted_rpc_urls:
+            return False
+
+        if time.time() - _blacklisted_rpc_urls[rpc_url] > 5:
+            _blacklisted_rpc_urls.pop(rpc_url, None)
+            return False
 
-    return True
+        return True
 
 
 def invalidate_rpc_cache_for_chain(chain: BlockchainNetwork) -> None:
@@ -57,7 +62,8 @@ def invalidate_rpc_cache_for_chain(chain: BlockchainNetwork) -> None:
     removed_provider = _resolved_web3_provider_cache.pop(chain, None)
     _resolved_async_web3_provider_cache.pop(chain, None)
     if removed_url:
-        _blacklisted_rpc_urls[removed_url] = time.time()
+        with _blacklisted_rpc_urls_lock:
+            _blacklisted_rpc_urls[removed_url] = time.time()
     if removed_url or removed_provider:
         logger.warning("[BLOCKCHAIN][RPC][REGISTRY] Invalidated cached RPC for %s (was %s) and temporarily blacklisted", chain.value, removed_url)
 
@@ -1,6 +1,7 @@
 from __future__ import annotations
 
 import asyncio
+import logging
 from typing import Dict, Iterable, List, Optional
 
 import httpx
@@ -98,11 +99,12 @@ async def fetch_dexscreener_token_information_list(
                 symbol_map[token.pair_address] = token.symbol
 
         for batch in _chunk_strings(pair_addresses, DEFAULT_MAX_ADDRESSES_PER_CALL):
-            symbols_in_batch = [symbol_map.get(address, "") for address in batch]
-            logger.debug(
-                "[DEX][TOKEN][INFORMATION] Fetching chain=%s batch_size=%d pairs=%s symbols=%s",
-                chain.value, len(batch), ",".join([tail(a) for a in batch]), ",".join([s for s in symbols_in_batch if s])
-            )
+            if logger.isEnabledFor(logging.DEBUG):
+                symbols_in_batch = [symbol_map.get(address, "") for address in batch]
+                logger.debug(
+                    "[DEX][TOKEN][INFORMATION] Fetching chain=%s batch_size=%d pairs=%s symbols=%s",
+                    chain.value, len(batch), ",".join([tail(a) for a in batch]), ",".join([s for s in symbols_in_batch if s])
+                )
             try:
                 token_information_list_fetched: List[DexscreenerTokenInformation] = \
                     await _fetch_token_information_for_chain(_client, chain, batch)
@@ -3,11 +3,12 @@ from __future__ import annotations
 from datetime import datetime
 from typing import List, Optional
 
-from sqlalchemy import select, desc
+from sqlalchemy import select, desc, update
 from sqlalchemy.orm import Session
 
+from src.core.structures.structures import DcaOrderStatus
 from src.logging.logger import get_application_logger
-from src.persistence.models import DcaOrder
+from src.persistence.models import DcaOrder, DcaStrategy
 
 logger = get_application_logger(__name__)
 
@@ -31,6 +32,16 @@ class DcaOrderDao:
     def retrieve_by_id(self, order_id: int) -> Optional[DcaOrder]:
         return self.database_session.get(DcaOrder, order_id)
 
+    def reopen_rejected_orders(self) -> int:
+        logger.debug("[DATABASE][DAO][DCA_ORDER][UPDATE] Moving rejected orders back to waiting user approval")
+        database_query = (
+            update(DcaOrder)
+            .where(DcaOrder.order_status == DcaOrderStatus.REJECTED)
+            .where(DcaOrder.strategy_id.in_(select(DcaStrategy.id)))
+            .values(order_status=DcaOrderStatus.WAITING_USER_APPROVAL)
+        )
+        return self.database_session.execute(database_query).rowcount
+
     def retrieve_pending_by_strategy(self, strategy_id: int) -> List[DcaOrder]:
         logger.debug("[DATABASE][DAO][DCA_ORDER][RETRIEVE] Fetching pending orders for strategy %d", strategy_id)
         database_query = (
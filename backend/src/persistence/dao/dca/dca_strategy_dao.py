@@ -3,7 +3,7 @@ from __future__ import annotations
 from typing import List, Optional
 
 from sqlalchemy import select
-from sqlalchemy.orm import Session
+from sqlalchemy.orm import Session, selectinload
 
 from src.logging.logger import get_application_logger
 from src.persistence.models import DcaStrategy
@@ -54,7 +54,7 @@ class DcaStrategyDao:
         self.save(dca_strategy)
 
     def retrieve_all(self) -> List[DcaStrategy]:
-        database_query = select(DcaStrategy)
+        database_query = select(DcaStrategy).options(selectinload(DcaStrategy.execution_orders))
         return list(self.database_session.execute(database_query).scalars().all())
 
     def delete(self, strategy_id: int) -> bool:
@@ -1,6 +1,6 @@
 from datetime import datetime
 
-from sqlalchemy import select, func
+from sqlalchemy import select, func, lambda_stmt
 from sqlalchemy.orm import Session
 
 from src.logging.logger import get_application_logger
@@ -22,6 +22,15 @@ class TradingShadowingProbeDao:
             logger.exception("[DAO][SHADOWING_PROBE] Failed to save probe — %s", error)
             raise
 
+    def bulk_save(self, probes: list[TradingShadowingProbe]) -> list[TradingShadowingProbe]:
+        try:
+            self.database_session.add_all(probes)
+            self.database_session.flush()
+            return probes
+        except Exception as error:
+            logger.exception("[DAO][SHADOWING_PROBE] Failed to bulk save %d probes — %s", len(probes), error)
+            raise
+
     def retrieve_oldest_probe_timestamp(self) -> float:
         from src.core.utils.date_utils import get_current_local_datetime
         try:
@@ -49,12 +58,12 @@ class TradingShadowingProbeDao:
 
     def retrieve_recent_probes_by_tokens(self, token_addresses: list[str], since: datetime) -> list[TradingShadowingProbe]:
         try:
-            return self.database_session.execute(
-                select(TradingShadowingProbe).where(
+            return self.database_session.execute(lambda_stmt(
+                lambda: select(TradingShadowingProbe).where(
                     TradingShadowingProbe.token_address.in_(token_addresses),
                     TradingShadowingProbe.probed_at >= since
                 )
-            ).scalars().all()
+            )).scalars().all()
         except Exception as error:
             logger.exception("[DAO][SHADOWING_PROBE] Failed to retrieve recent probes by tokens — %s", error)
             raise
@@ -1,6 +1,7 @@
 from datetime import datetime
+from typing import Iterator
 
-from sqlalchemy import select
+from sqlalchemy import Row, select
 from sqlalchemy.orm import Session
 
 from src.core.trading.shadowing.trading_shadowing_structures import ShadowIntelligenceStatusSummary
@@ -9,6 +10,17 @@ from src.persistence.models import TradingShadowingVerdict, TradingShadowingProb
 
 logger = get_application_logger(__name__)
 
+RESOLVED_VERDICT_CHRONICLE_COLUMNS = (
+    TradingShadowingVerdict.id,
+    TradingShadowingVerdict.resolved_at,
+    TradingShadowingVerdict.realized_pnl_percentage,
+    TradingShadowingVerdict.realized_pnl_usd,
+    TradingShadowingVerdict.is_profitable,
+    TradingShadowingVerdict.exit_reason,
+    TradingShadowingProbe.order_notional_value_usd,
+)
+RESOLVED_VERDICT_STREAM_BATCH_SIZE = 4096
+
 
 class TradingShadowingVerdictDao:
     def __init__(self, database_session: Session) -> None:
@@ -24,13 +36,15 @@ class TradingShadowingVerdictDao:
             raise
 
     def retrieve_pending_verdicts(self, limit_count: int) -> list[TradingShadowingVerdict]:
+        from sqlalchemy.orm import joinedload
         try:
             return list(self.database_session.scalars(
                 select(TradingShadowingVerdict)
+                .options(joinedload(TradingShadowingVerdict.probe))
                 .where(TradingShadowingVerdict.exit_reason.is_(None))
                 .order_by(TradingShadowingVerdict.created_at.desc())
                 .limit(limit_count)
-            ).all())
+            ).unique().all())
         except Exception as error:
             logger.exception("[DAO][SHADOWING_VERDICT] Failed to retrieve pending verdicts — %s", error)
             raise
@@ -50,17 +64,16 @@ class TradingShadowingVerdictDao:
             logger.exception("[DAO][SHADOWING_VERDICT] Failed to retrieve recent resolved verdicts — %s", error)
             raise
 
-    def retrieve_resolved_in_window(
+    def stream_resolved_in_window(
             self,
             start_datetime: datetime,
             end_datetime: datetime,
             limit_count: int,
-    ) -> list[TradingShadowingVerdict]:
-        from sqlalchemy.orm import joinedload
+    ) -> Iterator[Row]:
         try:
-            return list(self.database_session.scalars(
-                select(TradingShadowingVerdict)
-                .options(joinedload(TradingShadowingVerdict.probe))
+            yield from self.database_session.execute(
+                select(*RESOLVED_VERDICT_CHRONICLE_COLUMNS)
+                .join(TradingShadowingVerdict.probe)
                 .where(TradingShadowingVerdict.exit_reason.is_not(None))
                 .where(TradingShadowingVerdict.exit_reason != "STALED")
                 .where(TradingShadowingVerdict.resolved_at.is_not(None))
@@ -68,10 +81,11 @@ class TradingShadowingVerdictDao:
                 .where(TradingShadowingVerdict.resolved_at <= end_datetime)
                 .order_by(TradingShadowingVerdict.resolved_at.asc())
                 .limit(limit_count)
-            ).unique().all())
+                .execution_options(yield_per=RESOLVED_VERDICT_STREAM_BATCH_SIZE)
+            )
         except Exception as error:
             logger.exception(
-                "[DAO][SHADOWING_VERDICT] Failed to retrieve resolved verdicts in range [%s, %s] — %s",
+                "[DAO][SHADOWING_VERDICT] Failed to stream resolved verdicts in range [%s, %s] — %s",
                 start_datetime,
                 end_datetime,
                 error,
@@ -84,12 +98,11 @@ class TradingShadowingVerdictDao:
             start_datetime: datetime,
             end_datetime: datetime,
             limit_count: int,
-    ) -> list[TradingShadowingVerdict]:
-        from sqlalchemy.orm import joinedload
+    ) -> list[Row]:
         try:
-            return list(self.database_session.scalars(
-                select(TradingShadowingVerdict)
-                .options(joinedload(TradingShadowingVerdict.probe))
+            return list(self.database_session.execute(
+                select(*RESOLVED_VERDICT_CHRONICLE_COLUMNS)
+                .join(TradingShadowingVerdict.probe)
                 .where(TradingShadowingVerdict.id > after_id_exclusive)
                 .where(TradingShadowingVerdict.exit_reason.is_not(None))
                 .where(TradingShadowingVerdict.exit_reason != "STALED")
@@ -98,7 +111,7 @@ class TradingShadowingVerdictDao:
                 .where(TradingShadowingVerdict.resolved_at <= end_datetime)
                 .order_by(TradingShadowingVerdict.id.asc())
                 .limit(limit_count)
-            ).unique().all())
+            ).all())
         except Exception as error:
             logger.exception(
                 "[DAO][SHADOWING_VERDICT] Failed to retrieve resolved verdicts after id=%s in range [%s, %s] — %s",
@@ -3,8 +3,8 @@ from __future__ import annotations
 from datetime import datetime
 from typing import List, Optional
 
-from sqlalchemy import desc, select, and_
-from sqlalchemy.orm import Session
+from sqlalchemy import desc, func, select, and_
+from sqlalchemy.orm import Session, defer
 
 from src.logging.logger import get_application_logger
 from src.persistence.models import TradingEvaluation
@@ -43,15 +43,18 @@ class TradingEvaluationDao:
         return self.database_session.execute(database_query).unique().scalars().first()
 
     def retrieve_recent_evaluations(self, limit_count: int = 1000) -> List[TradingEvaluation]:
-        from sqlalchemy.orm import joinedload
         logger.debug("[DATABASE][DAO][TRADING_EVALUATION][RETRIEVE] Fetching up to %d recent evaluations", limit_count)
         database_query = (
             select(TradingEvaluation)
-            .options(joinedload(TradingEvaluation.outcomes))
+            .options(
+                defer(TradingEvaluation.shadow_intelligence_snapshot),
+                defer(TradingEvaluation.raw_dexscreener_payload),
+                defer(TradingEvaluation.raw_configuration_settings),
+            )
             .order_by(desc(TradingEvaluation.evaluated_at), desc(TradingEvaluation.id))
             .limit(limit_count)
         )
-        return list(self.database_session.execute(database_query).unique().scalars().all())
+        return list(self.database_session.execute(database_query).scalars().all())
 
     def retrieve_latest_buy_decision(self, token_address: str, before_timestamp: float) -> Optional[TradingEvaluation]:
         database_query = (
@@ -68,6 +71,34 @@ class TradingEvaluationDao:
         )
         return self.database_session.execute(database_query).scalars().first()
 
+    def retrieve_latest_buy_decisions_by_token_addresses(self, token_addresses: List[str], before_timestamp: float) -> dict[str, TradingEvaluation]:
+        if not token_addresses:
+            return {}
+        evaluation_rank = func.row_number().over(
+            partition_by=TradingEvaluation.token_address,
+            order_by=(desc(TradingEvaluation.evaluated_at), desc(TradingEvaluation.id)),
+        ).label("evaluation_rank")
+        ranked_evaluations = (
+            select(TradingEvaluation.id, evaluation_rank)
+            .where(
+                and_(
+                    TradingEvaluation.token_address.in_(set(token_addresses)),
+                    TradingEvaluation.evaluated_at <= datetime.fromtimestamp(before_timestamp),
+                    TradingEvaluation.execution_decision == "BUY"
+                )
+            )
+            .subquery()
+        )
+        database_query = (
+            select(TradingEvaluation)
+            .join(ranked_evaluations, TradingEvaluation.id == ranked_evaluations.c.id)
+            .where(ranked_evaluations.c.evaluation_rank == 1)
+        )
+        return {
+            evaluation.token_address: evaluation
+            for evaluation in self.database_session.execute(database_query).scalars().all()
+        }
+
     def count_total_evaluations(self) -> int:
         from sqlalchemy import func
         try:
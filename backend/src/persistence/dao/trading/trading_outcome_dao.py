@@ -1,12 +1,14 @@
 from __future__ import annotations
 
+from datetime import datetime
 from typing import List, Optional
 
-from sqlalchemy import desc, select
+from sqlalchemy import desc, func, select
 from sqlalchemy.orm import Session
 
+from src.core.structures.structures import EvaluationOutcomeAggregate
 from src.logging.logger import get_application_logger
-from src.persistence.models import TradingOutcome
+from src.persistence.models import TradingEvaluation, TradingOutcome
 
 logger = get_application_logger(__name__)
 
@@ -21,6 +23,11 @@ class TradingOutcomeDao:
         self.database_session.flush()
         return trading_outcome
 
+    def add_pending(self, trading_outcome: TradingOutcome) -> TradingOutcome:
+        logger.debug("[DATABASE][DAO][TRADING_OUTCOME][SAVE] Adding trading outcome record to the pending unit of work")
+        self.database_session.add(trading_outcome)
+        return trading_outcome
+
     def retrieve_by_id(self, outcome_id: int) -> Optional[TradingOutcome]:
         return self.database_session.get(TradingOutcome, outcome_id)
 
@@ -32,3 +39,36 @@ class TradingOutcomeDao:
             .limit(limit)
         )
         return list(self.database_session.execute(database_query).scalars().all())
+
+    def retrieve_aggregates_for_evaluations_since(self, evaluated_since: datetime) -> dict[int, EvaluationOutcomeAggregate]:
+        logger.debug("[DATABASE][DAO][TRADING_OUTCOME][AGGREGATE] Aggregating outcomes of evaluations since %s", evaluated_since)
+        window_evaluation_ids = select(TradingEvaluation.id).where(TradingEvaluation.evaluated_at >= evaluated_since)
+        windowed_outcomes = (
+            select(
+                TradingOutcome.evaluation_id,
+                TradingOutcome.exit_reason,
+                TradingOutcome.occurred_at,
+                func.count(TradingOutcome.id).over(partition_by=TradingOutcome.evaluation_id).label("outcome_count"),
+                func.sum(TradingOutcome.realized_profit_and_loss_usd).over(partition_by=TradingOutcome.evaluation_id).label("total_realized_profit_and_loss_usd"),
+                func.avg(TradingOutcome.realized_profit_and_loss_percentage).over(partition_by=TradingOutcome.evaluation_id).label("average_realized_profit_and_loss_percentage"),
+                func.avg(TradingOutcome.holding_duration_minutes).over(partition_by=TradingOutcome.evaluation_id).label("average_holding_duration_minutes"),
+                func.max(TradingOutcome.is_profitable).over(partition_by=TradingOutcome.evaluation_id).label("has_profitable_outcome"),
+                func.row_number().over(partition_by=TradingOutcome.evaluation_id, order_by=desc(TradingOutcome.id)).label("outcome_rank"),
+            )
+            .where(TradingOutcome.evaluation_id.in_(window_evaluation_ids))
+            .subquery()
+        )
+        database_query = select(windowed_outcomes).where(windowed_outcomes.c.outcome_rank == 1)
+        return {
+            aggregate_row.evaluation_id: EvaluationOutcomeAggregate(
+                evaluation_id=aggregate_row.evaluation_id,
+                outcome_count=aggregate_row.outcome_count,
+                total_realized_profit_and_loss_usd=aggregate_row.total_realized_profit_and_loss_usd,
+                average_realized_profit_and_loss_percentage=aggregate_row.average_realized_profit_and_loss_percentage,
+                average_holding_duration_minutes=aggregate_row.average_holding_duration_minutes,
+                has_profitable_outcome=aggregate_row.has_profitable_outcome,
+                last_exit_reason=aggregate_row.exit_reason,
+                last_occurred_at=aggregate_row.occurred_at,
+            )
+            for aggregate_row in self.database_session.execute(database_query).all()
+        }
@@ -2,25 +2,26 @@ from __future__ import annotations
 
 from typing import List, Optional
 
-from sqlalchemy import select, desc, asc
+from sqlalchemy import select, desc
 from sqlalchemy.orm import Session
 
 from src.core.structures.structures import EquityCurve, EquityCurvePoint
 from src.core.utils.date_utils import get_current_local_datetime
 from src.persistence.models import TradingPortfolioSnapshot
 
+SNAPSHOT_EXISTENCE_DATABASE_QUERY = select(TradingPortfolioSnapshot.id).limit(1)
+LATEST_SNAPSHOT_DATABASE_QUERY = select(TradingPortfolioSnapshot).order_by(desc(TradingPortfolioSnapshot.created_at)).limit(1)
+
 
 class TradingPortfolioSnapshotDao:
     def __init__(self, database_session: Session) -> None:
         self.database_session = database_session
 
-    def retrieve_initial_snapshot(self) -> Optional[TradingPortfolioSnapshot]:
-        database_query = select(TradingPortfolioSnapshot).order_by(asc(TradingPortfolioSnapshot.created_at)).limit(1)
-        return self.database_session.execute(database_query).scalar_one_or_none()
+    def has_any_snapshot(self) -> bool:
+        return self.database_session.execute(SNAPSHOT_EXISTENCE_DATABASE_QUERY).scalar() is not None
 
     def retrieve_latest_snapshot(self) -> Optional[TradingPortfolioSnapshot]:
-        database_query = select(TradingPortfolioSnapshot).order_by(desc(TradingPortfolioSnapshot.created_at)).limit(1)
-        return self.database_session.execute(database_query).scalar_one_or_none()
+        return self.database_session.execute(LATEST_SNAPSHOT_DATABASE_QUERY).scalar_one_or_none()
 
     def retrieve_snapshot_history(self, limit: int = 100) -> List[TradingPortfolioSnapshot]:
         database_query = select(TradingPortfolioSnapshot).order_by(desc(TradingPortfolioSnapshot.created_at)).limit(limit)
@@ -28,18 +29,18 @@ class TradingPortfolioSnapshotDao:
 
     def retrieve_equity_curve(self, limit_count: int = 100) -> EquityCurve:
         database_query = (
-            select(TradingPortfolioSnapshot)
+            select(TradingPortfolioSnapshot.created_at, TradingPortfolioSnapshot.total_equity_value)
             .order_by(desc(TradingPortfolioSnapshot.created_at))
             .limit(limit_count)
         )
-        equity_snapshots = list(self.database_session.execute(database_query).scalars().all())
+        equity_rows = self.database_session.execute(database_query).all()
 
         curve_points = [
             EquityCurvePoint(
-                timestamp_milliseconds=int(snapshot.created_at.timestamp() * 1000),
-                equity=snapshot.total_equity_value
+                timestamp_milliseconds=int(created_at.timestamp() * 1000),
+                equity=total_equity_value
             )
-            for snapshot in reversed(equity_snapshots)
+            for created_at, total_equity_value in reversed(equity_rows)
         ]
 
         return EquityCurve(curve_points=curve_points)
@@ -2,39 +2,68 @@ from __future__ import annotations
 
 from typing import List, Optional
 
-from sqlalchemy import select
+from sqlalchemy import func, select
 from sqlalchemy.orm import Session
 
+from src.core.structures.structures import OpenPositionIdentifiers
 from src.persistence.models import TradingPosition, PositionPhase
 
+OPEN_POSITION_IDENTIFIERS_DATABASE_QUERY = select(TradingPosition.token_symbol, TradingPosition.token_address).where(TradingPosition.current_quantity > 0)
+OPEN_POSITIONS_DATABASE_QUERY = select(TradingPosition).where(TradingPosition.current_quantity > 0)
+
 
 class TradingPositionDao:
     def __init__(self, database_session: Session) -> None:
         self.database_session = database_session
 
-    def retrieve_open_position_tokens(self) -> List[str]:
-        database_query = select(TradingPosition.token_address).where(TradingPosition.current_quantity > 0)
-        return list(self.database_session.execute(database_query).scalars().all())
+    def retrieve_open_position_identifiers(self) -> OpenPositionIdentifiers:
+        open_token_symbols: set[str] = set()
+        open_token_addresses: set[str] = set()
+        for token_symbol, token_address in self.database_session.execute(OPEN_POSITION_IDENTIFIERS_DATABASE_QUERY):
+            if token_symbol:
+                open_token_symbols.add(token_symbol.upper())
+            if token_address:
+                open_token_addresses.add(token_address)
+        return OpenPositionIdentifiers(
+            token_symbols=frozenset(open_token_symbols),
+            token_addresses=frozenset(open_token_addresses),
+        )
 
     def retrieve_open_positions(self) -> List[TradingPosition]:
-        database_query = select(TradingPosition).where(TradingPosition.current_quantity > 0)
-        return list(self.database_session.execute(database_query).scalars().all())
+        return list(self.database_session.execute(OPEN_POSITIONS_DATABASE_QUERY).scalars().all())
 
     def get_by_id(self, position_id: int) -> Optional[TradingPosition]:
         return self.database_session.get(TradingPosition, position_id)
 
+    def add_pending(self, trading_position: TradingPosition) -> TradingPosition:
+        self.database_session.add(trading_position)
+        return trading_position
+
     def save(self, trading_position: TradingPosition) -> TradingPosition:
         self.database_session.add(trading_position)
         self.database_session.flush()
         return trading_position
 
-    def retrieve_by_phase(self, target_phase: PositionPhase) -> List[TradingPosition]:
-        database_query = select(TradingPosition).where(TradingPosition.position_phase == target_phase)
-        return list(self.database_session.execute(database_query).scalars().all())
+    def retrieve_token_addresses_by_phase(self, target_phase: PositionPhase) -> set[str]:
+        database_query = select(TradingPosition.token_address).where(TradingPosition.position_phase == target_phase).distinct()
+        return set(self.database_session.execute(database_query).scalars().all())
 
-    def retrieve_by_evaluation_ids(self, evaluation_ids: List[int]) -> List[TradingPosition]:
+    def retrieve_latest_by_evaluation_ids(self, evaluation_ids: List[int]) -> List[TradingPosition]:
         normalized_ids = [evaluation_id for evaluation_id in evaluation_ids if evaluation_id is not None]
         if not normalized_ids:
             return []
-        database_query = select(TradingPosition).where(TradingPosition.evaluation_id.in_(normalized_ids))
+        evaluation_rank = func.row_number().over(
+            partition_by=TradingPosition.evaluation_id,
+            order_by=TradingPosition.id.desc(),
+        ).label("evaluation_rank")
+        ranked_positions = (
+            select(TradingPosition.id, evaluation_rank)
+            .where(TradingPosition.evaluation_id.in_(normalized_ids))
+            .subquery()
+        )
+        database_query = (
+            select(TradingPosition)
+            .join(ranked_positions, TradingPosition.id == ranked_positions.c.id)
+            .where(ranked_positions.c.evaluation_rank == 1)
+        )
         return list(self.database_session.execute(database_query).scalars().all())
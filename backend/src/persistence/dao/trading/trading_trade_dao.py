@@ -1,32 +1,66 @@
 from __future__ import annotations
 
+from datetime import datetime
 from typing import List, Optional
 
-from sqlalchemy import select, desc
+from sqlalchemy import select, desc, func, case, lambda_stmt
 from sqlalchemy.orm import Session
 
-from src.persistence.models import TradingTrade, ExecutionStatus
+from src.core.structures.structures import TradeCashFlowTotals
+from src.persistence.models import TradingTrade, TradeSide
+
+TRADE_NOTIONAL_EXPRESSION = TradingTrade.execution_price * TradingTrade.execution_quantity
+CASH_FLOW_TOTALS_DATABASE_QUERY = (
+    select(
+        func.coalesce(func.sum(case((TradingTrade.trade_side == TradeSide.BUY, TRADE_NOTIONAL_EXPRESSION), else_=0.0)), 0.0),
+        func.coalesce(func.sum(case((TradingTrade.trade_side == TradeSide.SELL, TRADE_NOTIONAL_EXPRESSION), else_=0.0)), 0.0),
+        func.coalesce(func.sum(TradingTrade.transaction_fee), 0.0),
+    )
+    .where(
+        TradingTrade.execution_quantity > 0.0,
+        TradingTrade.execution_price > 0.0,
+    )
+)
+LATEST_TRADE_ID_DATABASE_QUERY = select(func.max(TradingTrade.id))
 
 
 class TradingTradeDao:
     def __init__(self, database_session: Session) -> None:
         self.database_session = database_session
 
-    def retrieve_all_trades(self) -> List[TradingTrade]:
-        database_query = select(TradingTrade).order_by(desc(TradingTrade.created_at))
-        return list(self.database_session.execute(database_query).scalars().all())
-
     def retrieve_recent_trades(self, limit_count: int) -> List[TradingTrade]:
-        database_query = select(TradingTrade).order_by(desc(TradingTrade.created_at)).limit(limit_count)
+        database_query = lambda_stmt(lambda: select(TradingTrade).order_by(desc(TradingTrade.created_at)).limit(limit_count))
         return list(self.database_session.execute(database_query).scalars().all())
 
-    def retrieve_paper_trades(self) -> List[TradingTrade]:
-        database_query = select(TradingTrade).where(TradingTrade.execution_status == ExecutionStatus.PAPER).order_by(desc(TradingTrade.created_at))
-        return list(self.database_session.execute(database_query).scalars().all())
+    def retrieve_latest_trade_datetimes_after(self, token_addresses: List[str], traded_after: datetime) -> dict[str, datetime]:
+        database_query = lambda_stmt(
+            lambda: select(TradingTrade.token_address, func.max(TradingTrade.created_at))
+            .where(
+                TradingTrade.token_address.in_(token_addresses),
+                TradingTrade.created_at > traded_after,
+            )
+            .group_by(TradingTrade.token_address)
+        )
+        return {token_address: latest_traded_at for token_address, latest_traded_at in self.database_session.execute(database_query).all()}
+
+    def retrieve_cash_flow_totals(self) -> TradeCashFlowTotals:
+        total_buy_volume, total_sell_volume, total_fees_paid = self.database_session.execute(CASH_FLOW_TOTALS_DATABASE_QUERY).one()
+        return TradeCashFlowTotals(
+            total_buy_volume=total_buy_volume,
+            total_sell_volume=total_sell_volume,
+            total_fees_paid=total_fees_paid,
+        )
+
+    def retrieve_latest_trade_id(self) -> Optional[int]:
+        return self.database_session.execute(LATEST_TRADE_ID_DATABASE_QUERY).scalar_one()
 
     def get_by_id(self, trade_id: int) -> Optional[TradingTrade]:
         return self.database_session.get(TradingTrade, trade_id)
 
+    def add_pending(self, trading_trade: TradingTrade) -> TradingTrade:
+        self.database_session.add(trading_trade)
+        return trading_trade
+
     def save(self, trading_trade: TradingTrade) -> TradingTrade:
         self.database_session.add(trading_trade)
         self.database_session.flush()
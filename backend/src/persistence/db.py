@@ -4,7 +4,7 @@ from contextlib import contextmanager
 from pathlib import Path
 from typing import Generator
 
-from sqlalchemy import create_engine, event
+from sqlalchemy import create_engine, event, text
 from sqlalchemy.engine import URL, make_url
 from sqlalchemy.orm import Session, declarative_base, sessionmaker
 
@@ -31,6 +31,15 @@ def _build_database_connection_url() -> str:
 DATABASE_CONNECTION_URL: str = _build_database_connection_url()
 database_parsed_url = make_url(DATABASE_CONNECTION_URL)
 
+SQLITE_PERFORMANCE_PRAGMAS: tuple[str, ...] = (
+    "PRAGMA journal_mode=WAL;",
+    "PRAGMA synchronous=NORMAL;",
+    "PRAGMA temp_store=MEMORY;",
+    "PRAGMA busy_timeout=5000;",
+    "PRAGMA mmap_size=268435456;",
+    "PRAGMA cache_size=-65536;",
+)
+
 database_connection_arguments: dict[str, bool] = {}
 
 if database_parsed_url.drivername.startswith("sqlite"):
@@ -41,7 +50,8 @@ database_engine = create_engine(
     connect_args=database_connection_arguments,
     pool_pre_ping=True,
     pool_size=20,
-    max_overflow=0
+    max_overflow=0,
+    query_cache_size=1200
 )
 
 DatabaseSessionLocal = sessionmaker(
@@ -59,10 +69,10 @@ if database_parsed_url.drivername.startswith("sqlite"):
         def _apply_sqlite_performance_pragmas(database_api_connection, connection_record) -> None:
             try:
                 database_cursor = database_api_connection.cursor()
-                database_cursor.execute("PRAGMA journal_mode=WAL;")
-                database_cursor.execute("PRAGMA synchronous=NORMAL;")
+                for performance_pragma in SQLITE_PERFORMANCE_PRAGMAS:
+                    database_cursor.execute(performance_pragma)
                 database_cursor.close()
-                logger.debug("[DATABASE][SQLITE][PRAGMA] Performance pragmas WAL and NORMAL successfully applied to connection")
+                logger.debug("[DATABASE][SQLITE][PRAGMA] %d performance pragmas successfully applied to connection", len(SQLITE_PERFORMANCE_PRAGMAS))
             except Exception as exception:
                 logger.exception("[DATABASE][SQLITE][PRAGMA] Failed to apply performance pragmas due to error: %s", exception)
 
@@ -94,10 +104,37 @@ def get_fastapi_database_session() -> Generator[Session, None, None]:
         database_session.close()
 
 
+def _create_missing_table_indexes() -> None:
+    for table in DatabaseBaseModel.metadata.sorted_tables:
+        for table_index in table.indexes:
+            table_index.create(bind=database_engine, checkfirst=True)
+    logger.debug("[DATABASE][INITIALIZATION][INDEX] Missing indexes created on pre-existing tables")
+
+
+def _drop_trade_side_index_covered_by_cash_flow_index() -> None:
+    with database_engine.begin() as database_connection:
+        database_connection.execute(text("DROP INDEX IF EXISTS ix_trading_trades_trade_side"))
+    logger.debug("[DATABASE][INITIALIZATION][INDEX] Trade side index covered by the cash flow index dropped")
+
+
+def _normalize_stored_blockchain_network_labels() -> None:
+    with database_engine.begin() as database_connection:
+        for table_name in ("trading_positions", "trading_trades", "trading_evaluations", "trading_shadowing_probes", "dca_strategies"):
+            normalization_result = database_connection.execute(text(
+                f"UPDATE {table_name} SET blockchain_network = LOWER(TRIM(blockchain_network)) "
+                f"WHERE blockchain_network != LOWER(TRIM(blockchain_network))"
+            ))
+            if normalization_result.rowcount:
+                logger.info("[DATABASE][INITIALIZATION][MIGRATION] Normalized blockchain network label on %d rows of %s", normalization_result.rowcount, table_name)
+
+
 def initialize_database() -> None:
     logger.info("[DATABASE][INITIALIZATION] Starting database schema creation process")
     try:
         DatabaseBaseModel.metadata.create_all(bind=database_engine)
+        _create_missing_table_indexes()
+        _drop_trade_side_index_covered_by_cash_flow_index()
+        _normalize_stored_blockchain_network_labels()
         logger.info("[DATABASE][INITIALIZATION] Database schema successfully created on target engine")
     except Exception as initialization_exception:
         logger.exception("[DATABASE][INITIALIZATION] Failed to create database schema due to error: %s", initialization_exception)
@@ -4,21 +4,14 @@ from datetime import datetime
 from enum import Enum
 from typing import Optional
 
-from sqlalchemy import Enum as SQLAlchemyEnum, Float, Integer, String, JSON, Boolean, ForeignKey
-from sqlalchemy.orm import Mapped, mapped_column, relationship
+from sqlalchemy import Enum as SQLAlchemyEnum, Float, Integer, String, JSON, Boolean, ForeignKey, Index
+from sqlalchemy.orm import Mapped, mapped_column, relationship, validates
 
-from src.core.structures.structures import DcaStrategyStatus, DcaOrderStatus
+from src.core.structures.structures import BlockchainNetwork, DcaStrategyStatus, DcaOrderStatus, PositionPhase
 from src.core.utils.date_utils import get_current_local_datetime
 from src.persistence.db import DatabaseBaseModel
 
 
-class PositionPhase(Enum):
-    OPEN = "OPEN"
-    PARTIAL = "PARTIAL"
-    CLOSED = "CLOSED"
-    STALED = "STALED"
-
-
 class TradeSide(Enum):
     BUY = "BUY"
     SELL = "SELL"
@@ -29,8 +22,17 @@ class ExecutionStatus(Enum):
     LIVE = "LIVE"
 
 
+def normalize_blockchain_network_label(blockchain_network: str) -> str:
+    return BlockchainNetwork(blockchain_network.strip().lower()).value
+
+
 class TradingPosition(DatabaseBaseModel):
     __tablename__ = "trading_positions"
+    __table_args__ = (
+        Index("ix_trading_positions_phase_token_address", "position_phase", "token_address"),
+        Index("ix_trading_positions_current_quantity", "current_quantity"),
+        Index("ix_trading_positions_evaluation_id_id", "evaluation_id", "id"),
+    )
 
     id: Mapped[int] = mapped_column(Integer, primary_key=True, autoincrement=True)
     evaluation_id: Mapped[int] = mapped_column(ForeignKey("trading_evaluations.id"), nullable=False)
@@ -50,16 +52,25 @@ class TradingPosition(DatabaseBaseModel):
     updated_at: Mapped[datetime] = mapped_column(default=get_current_local_datetime, onupdate=get_current_local_datetime, nullable=False)
     closed_at: Mapped[Optional[datetime]] = mapped_column(default=None, nullable=True)
 
+    @validates("blockchain_network")
+    def _normalize_blockchain_network(self, attribute_name: str, blockchain_network: str) -> str:
+        return normalize_blockchain_network_label(blockchain_network)
+
     def __repr__(self) -> str:
         return f"<TradingPosition token_symbol={self.token_symbol} token_address={self.token_address[-6:]} open_quantity={self.open_quantity} position_phase={self.position_phase}>"
 
 
 class TradingTrade(DatabaseBaseModel):
     __tablename__ = "trading_trades"
+    __table_args__ = (
+        Index("ix_trading_trades_created_at_id", "created_at", "id"),
+        Index("ix_trading_trades_token_address_created_at", "token_address", "created_at"),
+        Index("ix_trading_trades_cash_flow", "trade_side", "execution_quantity", "execution_price", "transaction_fee"),
+    )
 
     id: Mapped[int] = mapped_column(Integer, primary_key=True, autoincrement=True)
     evaluation_id: Mapped[int] = mapped_column(ForeignKey("trading_evaluations.id"), nullable=False)
-    trade_side: Mapped[TradeSide] = mapped_column(SQLAlchemyEnum(TradeSide), index=True)
+    trade_side: Mapped[TradeSide] = mapped_column(SQLAlchemyEnum(TradeSide))
     token_symbol: Mapped[str] = mapped_column(String(24), index=True)
     blockchain_network: Mapped[str] = mapped_column(String(32), nullable=False)
     execution_price: Mapped[float] = mapped_column(Float, nullable=False)
@@ -73,12 +84,19 @@ class TradingTrade(DatabaseBaseModel):
     transaction_hash: Mapped[Optional[str]] = mapped_column(String(128), nullable=True)
     created_at: Mapped[datetime] = mapped_column(default=get_current_local_datetime, nullable=False)
 
+    @validates("blockchain_network")
+    def _normalize_blockchain_network(self, attribute_name: str, blockchain_network: str) -> str:
+        return normalize_blockchain_network_label(blockchain_network)
+
     def __repr__(self) -> str:
         return f"<TradingTrade trade_side={self.trade_side} token_symbol={self.token_symbol} execution_quantity={self.execution_quantity} execution_price={self.execution_price}>"
 
 
 class TradingPortfolioSnapshot(DatabaseBaseModel):
     __tablename__ = "trading_portfolio_snapshots"
+    __table_args__ = (
+        Index("ix_trading_portfolio_snapshots_created_at_id", "created_at", "id"),
+    )
 
     id: Mapped[int] = mapped_column(Integer, primary_key=True, autoincrement=True)
     total_equity_value: Mapped[float] = mapped_column(Float, nullable=False)
@@ -92,6 +110,11 @@ class TradingPortfolioSnapshot(DatabaseBaseModel):
 
 class TradingEvaluation(DatabaseBaseModel):
     __tablename__ = "trading_evaluations"
+    __table_args__ = (
+        Index("ix_trading_evaluations_evaluated_at_id", "evaluated_at", "id"),
+        Index("ix_trading_evaluations_token_address_decision_evaluated_at", "token_address", "execution_decision", "evaluated_at"),
+        Index("ix_trading_evaluations_pair_address_evaluated_at", "pair_address", "evaluated_at"),
+    )
 
     id: Mapped[int] = mapped_column(Integer, primary_key=True, autoincrement=True)
     token_symbol: Mapped[str] = mapped_column(String(24), index=True, nullable=False)
@@ -134,9 +157,17 @@ class TradingEvaluation(DatabaseBaseModel):
     raw_configuration_settings: Mapped[dict[str, object]] = mapped_column(JSON, nullable=False, default=dict)
     outcomes: Mapped[list[TradingOutcome]] = relationship("TradingOutcome", back_populates="evaluation", cascade="all, delete-orphan")
 
+    @validates("blockchain_network")
+    def _normalize_blockchain_network(self, attribute_name: str, blockchain_network: str) -> str:
+        return normalize_blockchain_network_label(blockchain_network)
+
 
 class TradingShadowingProbe(DatabaseBaseModel):
     __tablename__ = "trading_shadowing_probes"
+    __table_args__ = (
+        Index("ix_trading_shadowing_probes_token_address_probed_at", "token_address", "probed_at"),
+        Index("ix_trading_shadowing_probes_probed_at", "probed_at"),
+    )
 
     id: Mapped[int] = mapped_column(Integer, primary_key=True, autoincrement=True)
     token_symbol: Mapped[str] = mapped_column(String(24), index=True, nullable=False)
@@ -170,12 +201,20 @@ class TradingShadowingProbe(DatabaseBaseModel):
     created_at: Mapped[datetime] = mapped_column(default=get_current_local_datetime, nullable=False)
     verdict: Mapped[Optional[TradingShadowingVerdict]] = relationship("TradingShadowingVerdict", back_populates="probe", uselist=False, cascade="all, delete-orphan")
 
+    @validates("blockchain_network")
+    def _normalize_blockchain_network(self, attribute_name: str, blockchain_network: str) -> str:
+        return normalize_blockchain_network_label(blockchain_network)
+
     def __repr__(self) -> str:
         return f"<TradingShadowingProbe token_symbol={self.token_symbol} token_address={self.token_address[-6:]} entry_price_usd={self.entry_price_usd}>"
 
 
 class TradingShadowingVerdict(DatabaseBaseModel):
     __tablename__ = "trading_shadowing_verdicts"
+    __table_args__ = (
+        Index("ix_trading_shadowing_verdicts_exit_reason_created_at", "exit_reason", "created_at"),
+        Index("ix_trading_shadowing_verdicts_resolved_at", "resolved_at"),
+    )
 
     id: Mapped[int] = mapped_column(Integer, primary_key=True, autoincrement=True)
     probe_id: Mapped[int] = mapped_column(ForeignKey("trading_shadowing_probes.id"), nullable=False, unique=True, index=True)
@@ -251,12 +290,21 @@ class DcaStrategy(DatabaseBaseModel):
     updated_at: Mapped[datetime] = mapped_column(nullable=False)
     execution_orders: Mapped[list[DcaOrder]] = relationship("DcaOrder", back_populates="parent_strategy", cascade="all, delete-orphan")
 
+    @validates("blockchain_network")
+    def _normalize_blockchain_network(self, attribute_name: str, blockchain_network: str) -> str:
+        return normalize_blockchain_network_label(blockchain_network)
+
     def __repr__(self) -> str:
         return f"<DcaStrategy identifier={self.id} blockchain_network={self.blockchain_network} routing={self.source_asset_symbol}->{self.target_asset_symbol}>"
 
 
 class DcaOrder(DatabaseBaseModel):
     __tablename__ = "dca_orders"
+    __table_args__ = (
+        Index("ix_dca_orders_strategy_id_planned_execution_date", "strategy_id", "planned_execution_date"),
+        Index("ix_dca_orders_order_status_planned_execution_date", "order_status", "planned_execution_date"),
+        Index("ix_dca_orders_order_status_executed_at", "order_status", "executed_at"),
+    )
 
     id: Mapped[int] = mapped_column(Integer, primary_key=True, autoincrement=True)
     strategy_id: Mapped[int] = mapped_column(ForeignKey("dca_strategies.id"), nullable=False)
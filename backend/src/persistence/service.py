@@ -16,14 +16,20 @@ from src.persistence.models import (
 
 logger = get_application_logger(__name__)
 
+PAPER_RESET_MODELS_IN_DEPENDENCY_ORDER = (
+    TradingOutcome,
+    TradingTrade,
+    TradingPosition,
+    TradingPortfolioSnapshot,
+    TradingEvaluation,
+    DcaOrder,
+    DcaStrategy,
+)
+
 
 def reset_paper(database_session: Session) -> None:
-    database_session.execute(delete(TradingTrade))
-    database_session.execute(delete(TradingPosition))
-    database_session.execute(delete(TradingPortfolioSnapshot))
-    database_session.execute(delete(TradingEvaluation))
-    database_session.execute(delete(TradingOutcome))
-    database_session.execute(delete(DcaOrder))
-    database_session.execute(delete(DcaStrategy))
+    for paper_model in PAPER_RESET_MODELS_IN_DEPENDENCY_ORDER:
+        deletion_result = database_session.execute(delete(paper_model))
+        logger.debug("[DATABASE][SERVICE][RESET] Removed %d rows from %s", deletion_result.rowcount, paper_model.__tablename__)
     database_session.commit()
     logger.info("[DATABASE][SERVICE][RESET] Paper state has been reset (trades, positions, snapshots, evaluations, outcomes, and DCA records removed)")